@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Requests run in many threads and event loop tasks, so persistent
+# per-thread connections would pile up; share a pool instead
+os.environ.setdefault('DB_CONNECTION_MODE', 'pool')
 
 application = get_asgi_application()
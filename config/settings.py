@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 import os
+import copy
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'core',
@@ -47,12 +49,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.HashingBusyMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -92,6 +96,87 @@ DATABASES = {
     }
 }
 
+# How connections are reused (DB_CONNECTION_MODE):
+# - 'pool': a psycopg connection pool per process, for ASGI and threaded
+#   servers. Connections are checked before they are handed out.
+# - 'persistent': each worker thread keeps its connection for
+#   DB_CONN_MAX_AGE seconds and checks it at the start of a request.
+# - 'off': a new connection for every request.
+# config/asgi.py defaults to 'pool', everything else to 'persistent'.
+DB_CONNECTION_MODE = os.getenv('DB_CONNECTION_MODE', 'persistent')
+
+if DB_CONNECTION_MODE == 'pool':
+    from psycopg_pool import ConnectionPool
+
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', 600)),
+            'check': ConnectionPool.check_connection,
+        },
+    }
+elif DB_CONNECTION_MODE == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+elif DB_CONNECTION_MODE != 'off':
+    from django.core.exceptions import ImproperlyConfigured
+
+    raise ImproperlyConfigured(
+        f"DB_CONNECTION_MODE must be 'pool', 'persistent' or 'off', not {DB_CONNECTION_MODE!r}"
+    )
+
+# Read replicas (POSTGRES_REPLICA_HOSTS, comma-separated): each host becomes
+# a 'replicaN' alias with the primary's settings. Safe requests read from
+# them; writes, and reads by clients that wrote in the last
+# REPLICA_PIN_SECONDS, use the primary (see core.routers).
+# Pointing a replica at the primary's own host tries it out locally.
+DATABASE_REPLICAS = []
+for number, host in enumerate(filter(None, os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',')), 1):
+    alias = f'replica{number}'
+    DATABASES[alias] = {
+        **copy.deepcopy(DATABASES['default']),
+        'HOST': host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+# Task shards (TASK_SHARD_DATABASES, comma-separated): each entry becomes a
+# 'shardN' alias holding the tasks of the users that hash to it, with a
+# copy of every user (see core.sharding). An entry is 'default' for the
+# primary or 'host/name' for a PostgreSQL database with the primary's
+# credentials; several databases on the local server try sharding out.
+# Run migrate --database and prepare_task_shards for each new shard.
+TASK_SHARDS = []
+for number, entry in enumerate(filter(None, os.getenv('TASK_SHARD_DATABASES', '').split(',')), 1):
+    entry = entry.strip()
+    if entry == 'default':
+        TASK_SHARDS.append(entry)
+        continue
+    alias = f'shard{number}'
+    host, _, name = entry.partition('/')
+    DATABASES[alias] = {**copy.deepcopy(DATABASES['default']), 'HOST': host, 'NAME': name}
+    TASK_SHARDS.append(alias)
+
+DATABASE_ROUTERS = ['core.sharding.ShardRouter', 'core.routers.PrimaryReplicaRouter']
+
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 10))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -112,6 +197,22 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Passwords are hashed on a bounded thread pool per process (see
+# core.hashing). Keep workers plus queue below the server's request threads,
+# so logins and signups never occupy all of them; when both are taken,
+# further ones get 429 at once. The other hashers only verify old hashes.
+PASSWORD_HASHERS = [
+    'core.hashing.PooledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', 2))
+PASSWORD_HASHING_QUEUE = int(os.getenv('PASSWORD_HASHING_QUEUE', 8))
+PASSWORD_HASHING_RETRY_AFTER = 1
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -136,13 +237,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.FastJSONRenderer',
+        ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
         ],
     'DEFAULT_FILTER_BACKEND': [
         'django_filters.rest_framework.DjangoFilterBackend'
         ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
@@ -170,4 +276,19 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
-}
\ No newline at end of file
+}
+
+# Users resolved from JWTs are cached to skip a query per request
+# and dropped when saved or deleted. With a local-memory cache, other
+# processes keep a changed user until AUTH_USER_CACHE_TIMEOUT: use a
+# shared cache when running several workers.
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TIMEOUT = 300
+
+# Task list responses are cached under the task collection version
+TASK_LIST_CACHE_ALIAS = 'default'
+TASK_LIST_CACHE_TIMEOUT = 300
+
+# Serve the task list, detail and completion endpoints with async views.
+# Only useful under an ASGI server (see config/asgi.py)
+ASYNC_TASK_VIEWS = os.getenv('ASYNC_TASK_VIEWS', '') == '1'
\ No newline at end of file
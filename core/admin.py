@@ -1,7 +1,18 @@
+from datetime import datetime, timezone as dt_timezone
 
 from django.contrib import admin
+from django.contrib.admin import helpers
+from django.contrib.admin.options import IncorrectLookupParameters
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, Task
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Max, Min, Q
+from django.template.response import TemplateResponse
+from django.utils.html import format_html
+from django.utils.text import capfirst
+
+from . import partitions, sharding
+from .models import SEARCH_CONFIG, ArchivedTask, CustomUser, Task, TaskCounter, TaskQuerySet
+from .pagination import EstimatedCountPaginator
 
 
 @admin.register(CustomUser)
@@ -12,16 +23,141 @@ class CustomUserAdmin(UserAdmin):
     search_fields = ('username', 'first_name', 'last_name')
     ordering = ('-date_joined',)
 
+    def get_deleted_objects(self, objs, request):
+        """
+        List the users and count their tasks, instead of loading every
+        task to list it on the confirmation page
+        """
+        users = list(objs)
+        to_delete = [format_html('{}: {}', capfirst(CustomUser._meta.verbose_name), user) for user in users]
+        model_count = {CustomUser._meta.verbose_name_plural: len(users)}
+        perms_needed = set()
+        for model in (Task, ArchivedTask):
+            if model is Task:
+                count = sum(sum(TaskCounter.objects.for_user(user).values()) for user in users)
+            else:
+                count = sum(model.objects.owned_by(user).count() for user in users)
+            if not count:
+                continue
+            model_count[model._meta.verbose_name_plural] = count
+            # As the default collector does, only admin-managed models need permission
+            admin = self.admin_site._registry.get(model)
+            if admin is not None and not admin.has_delete_permission(request):
+                perms_needed.add(model._meta.verbose_name)
+        return to_delete, model_count, perms_needed, []
+
+    def delete_queryset(self, request, queryset):
+        # CustomUser.delete() removes the tasks in batches first
+        for user in queryset:
+            user.delete()
+
+
+class CreatedMonthFilter(admin.SimpleListFilter):
+    """
+    Drill down by month of creation. Replaces date_hierarchy, whose links
+    take a DISTINCT over every task: the months run back from the newest
+    task to the oldest, read from the ends of the created_at index, and
+    each one filters a range, which on PostgreSQL reads one partition.
+    """
+    title = 'created month'
+    parameter_name = 'created_month'
+    months = 36
+
+    def lookups(self, request, model_admin):
+        bounds = model_admin.get_queryset(request).aggregate(first=Min('created_at'), last=Max('created_at'))
+        if bounds['first'] is None:
+            return []
+        first, month = partitions.month_start(bounds['first']), partitions.month_start(bounds['last'])
+        lookups = []
+        while month >= first and len(lookups) < self.months:
+            lookups.append((f'{month:%Y-%m}', f'{month:%B %Y}'))
+            month = partitions.add_months(month, -1)
+        return lookups
+
+    def queryset(self, request, queryset):
+        if self.value() is None:
+            return queryset
+        try:
+            month = datetime.strptime(self.value(), '%Y-%m').replace(tzinfo=dt_timezone.utc)
+        except ValueError:
+            raise IncorrectLookupParameters(f"Invalid month {self.value()!r}")
+        return queryset.filter(created_at__gte=month, created_at__lt=partitions.add_months(month, 1))
+
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
-    """Admin configuration for Task"""
+    """
+    Admin configuration for Task, built for tables of many millions of
+    tasks: owners are joined, page totals are estimated, and actions run
+    as single set-based statements
+    """
     list_display = ('title', 'user', 'status', 'created_at', 'updated_at')
-    list_filter = ('status', 'created_at', 'updated_at')
+    list_select_related = ('user',)
+    list_filter = ('status', CreatedMonthFilter, 'created_at', 'updated_at')
     search_fields = ('title', 'description', 'user__username')
+    search_help_text = "Full-text search over title and description, or an exact username"
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at')
-    date_hierarchy = 'created_at'
+    paginator = EstimatedCountPaginator
+    # Filtered changelists would otherwise also count every task
+    show_full_result_count = False
+    actions = ['mark_completed', 'delete_tasks']
+
+    def get_queryset(self, request):
+        """Tasks of every shard, merge-sorted by the changelist ordering"""
+        return sharding.fan_out(super().get_queryset(request))
+
+    def get_actions(self, request):
+        # delete_selected loads, logs and lists every selected task
+        actions = super().get_actions(request)
+        actions.pop('delete_selected', None)
+        return actions
+
+    @admin.action(description="Mark selected tasks as completed", permissions=['change'])
+    def mark_completed(self, request, queryset):
+        updated = queryset.exclude(status=TaskQuerySet.COMPLETED).update(status=TaskQuerySet.COMPLETED)
+        self.message_user(request, f"Marked {updated} tasks as completed.")
+
+    @admin.action(description="Delete selected tasks", permissions=['delete'])
+    def delete_tasks(self, request, queryset):
+        """
+        Delete the selection in one statement per database, after a
+        confirmation page that counts the tasks instead of listing them
+        """
+        if request.POST.get('post'):
+            deleted, _ = queryset.delete()
+            self.message_user(request, f"Deleted {deleted} tasks.")
+            return None
+        select_across = request.POST.get('select_across') == '1'
+        paginator = EstimatedCountPaginator(queryset, 1)
+        context = {
+            **self.admin_site.each_context(request),
+            'title': "Are you sure?",
+            'opts': self.model._meta,
+            'count': paginator.count,
+            'estimated': paginator.count >= paginator.exact_below,
+            'select_across': int(select_across),
+            # The changelist only runs actions posted with checked ids, even
+            # across the whole selection; a page of them at most
+            'selected': request.POST.getlist(helpers.ACTION_CHECKBOX_NAME),
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+        }
+        return TemplateResponse(request, 'admin/core/task/delete_tasks_confirmation.html', context)
+
+    def get_readonly_fields(self, request, obj=None):
+        # Changing the owner would have to move the task to another shard
+        if obj is not None and sharding.is_sharded():
+            return (*self.readonly_fields, 'user')
+        return self.readonly_fields
+
+    def get_search_results(self, request, queryset, search_term):
+        """Use the full-text index instead of icontains scans"""
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        query = SearchQuery(search_term, config=SEARCH_CONFIG, search_type='websearch')
+        owned = CustomUser.objects.filter(username=search_term).values('pk')
+        return queryset.filter(Q(search_vector=query) | Q(user__in=owned)), False
 
     fieldsets = (
         (None, {
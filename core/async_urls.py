@@ -0,0 +1,18 @@
+from django.urls import path
+
+from .async_views import AsyncMarkTaskCompletedView, AsyncTaskDetailView, AsyncTaskListCreateView
+from .urls import urlpatterns as sync_urlpatterns
+
+
+# Same routes and names as core.urls, with the async views swapped in
+ASYNC_VIEWS = {
+    'task-list-create': AsyncTaskListCreateView,
+    'task-detail': AsyncTaskDetailView,
+    'task-complete': AsyncMarkTaskCompletedView,
+}
+
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name)
+    if pattern.name in ASYNC_VIEWS else pattern
+    for pattern in sync_urlpatterns
+]
@@ -0,0 +1,222 @@
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import exceptions, generics, mixins, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import response_cache
+from .models import Task, TaskVersion
+from .serializers import (
+    TaskSerializer,
+    TaskCreateSerializer,
+    TaskUpdateSerializer,
+    TaskValuesSerializer
+)
+from .views import (
+    ConditionalDetailMixin,
+    IsOwner,
+    TaskCollectionMixin,
+    TaskFieldsMixin,
+    TaskFilterMixin,
+    make_etag,
+    set_validators
+)
+
+
+class AsyncAPIViewMixin:
+    """
+    Mixin turning an APIView into an async view. Authentication and the
+    handlers are awaited; the rest of APIView.dispatch (negotiation,
+    permissions, exception handling, rendering) is CPU-only and is reused
+    as is. Handlers use the async ORM, so a request holds a thread only
+    while one of its queries runs.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.authenticate(request)
+            self.initial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        response = self.finalize_response(request, response, *args, **kwargs)
+        return self.render_response(response)
+
+    async def authenticate(self, request):
+        """
+        Request._authenticate with awaited authenticators, so that
+        perform_authentication() finds the user already resolved
+        """
+        for authenticator in request.authenticators:
+            try:
+                user_auth = await authenticator.aauthenticate(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+            if user_auth is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth
+                return
+        request._not_authenticated()
+
+    def render_response(self, response):
+        """
+        Render DRF responses here; Django would render them in a worker
+        thread otherwise
+        """
+        if not isinstance(response, Response):
+            return response
+        response.render()
+        rendered = HttpResponse(response.content, status=response.status_code)
+        del rendered['Content-Type']
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
+
+
+class AsyncTaskListCreateView(AsyncAPIViewMixin, TaskFieldsMixin, TaskFilterMixin,
+                              TaskCollectionMixin, generics.GenericAPIView):
+    """
+    Async version of TaskListCreateView
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Return tasks for the current user only"""
+        return Task.objects.owned_by(self.request.user).select_related('user')
+
+    async def get(self, request, *args, **kwargs):
+        token, last_modified = await TaskVersion.objects.afor_user(request.user)
+        etag = make_etag(
+            'list', self.get_collection_scope(), token,
+            request.get_full_path(), request.accepted_media_type
+        )
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp())
+        )
+        if response is None:
+            response = await self.cached_list(request, token)
+        return set_validators(response, etag, last_modified)
+
+    async def cached_list(self, request, token):
+        key = response_cache.make_key(self.get_collection_scope(), token, request)
+        data = await response_cache.alookup(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        serializer = TaskValuesSerializer(fields=self.get_requested_fields())
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
+        # Paginators count and fetch synchronously; run them the way the
+        # async ORM runs its own queries
+        page = await sync_to_async(self.paginate_queryset)(queryset)
+        response = self.get_paginated_response(serializer.to_representation(page))
+        await response_cache.astore(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    async def post(self, request, *args, **kwargs):
+        serializer = TaskCreateSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        serializer.instance = await Task.objects.acreate(user=request.user, **serializer.validated_data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AsyncTaskDetailView(AsyncAPIViewMixin, ConditionalDetailMixin, TaskFieldsMixin,
+                          mixins.UpdateModelMixin, mixins.DestroyModelMixin, generics.GenericAPIView):
+    """
+    Async version of TaskDetailView. Writes with If-Match/If-Unmodified-Since
+    lock the row in a transaction, which Django only runs synchronously, so
+    they go through the sync implementation in a worker thread.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+
+    def get_queryset(self):
+        """Return tasks for the current user only"""
+        return Task.objects.owned_by(self.request.user).select_related('user')
+
+    def get_serializer_class(self):
+        if self.request.method in ['PUT', 'PATCH']:
+            return TaskUpdateSerializer
+        return TaskSerializer
+
+    def has_preconditions(self, request):
+        return any(header in request.META for header in self.PRECONDITION_HEADERS)
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            task = await queryset.aget(pk=self.kwargs['pk'])
+        except Task.DoesNotExist:
+            raise Http404(f"No {Task._meta.object_name} matches the given query.")
+        self.check_object_permissions(self.request, task)
+        return task
+
+    async def get(self, request, *args, **kwargs):
+        task = await self.aget_object()
+        response, etag, last_modified = self.evaluate_preconditions(request, task.updated_at)
+        if response is None:
+            response = Response(self.get_serializer(task).data)
+        return set_validators(response, etag, last_modified)
+
+    async def put(self, request, *args, **kwargs):
+        return await self.aupdate(request, *args, **kwargs)
+
+    async def patch(self, request, *args, **kwargs):
+        kwargs['partial'] = True
+        return await self.aupdate(request, *args, **kwargs)
+
+    async def aupdate(self, request, *args, **kwargs):
+        if self.has_preconditions(request):
+            return await sync_to_async(self.update)(request, *args, **kwargs)
+        task = await self.aget_object()
+        serializer = self.get_serializer(task, data=request.data, partial=kwargs.get('partial', False))
+        serializer.is_valid(raise_exception=True)
+        for attr, value in serializer.validated_data.items():
+            setattr(task, attr, value)
+        await task.asave()
+        return Response(serializer.data)
+
+    async def delete(self, request, *args, **kwargs):
+        if self.has_preconditions(request):
+            return await sync_to_async(self.destroy)(request, *args, **kwargs)
+        task = await self.aget_object()
+        await task.adelete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncMarkTaskCompletedView(AsyncAPIViewMixin, APIView):
+    """
+    Async version of MarkTaskCompletedView
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def post(self, request, pk):
+        task = await Task.objects.acomplete_one(pk, request.user)
+        if task is None:
+            raise Http404
+
+        serializer = TaskSerializer(task)
+        return Response({
+            'message': 'Task marked as completed.',
+            'task': serializer.data
+        }, status=status.HTTP_200_OK)
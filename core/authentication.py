@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+USER_CACHE_KEY = 'auth:user:{}'
+
+
+def get_user_cache():
+    return caches[getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default')]
+
+
+def user_cache_key(user_id):
+    return USER_CACHE_KEY.format(user_id)
+
+
+def invalidate_cached_user(user_id):
+    """
+    Drop a user from the authentication cache
+    """
+    get_user_cache().delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves the ``user_id`` claim through the cache
+    configured by ``AUTH_USER_CACHE_ALIAS`` instead of a query per request.
+
+    Entries expire after ``AUTH_USER_CACHE_TIMEOUT`` seconds and are dropped
+    whenever a user is saved or deleted (see ``core.signals``), so changes to
+    ``is_active`` or the password take effect on the next request.
+    """
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def check_user(self, user, validated_token):
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+        return user
+
+    def get_user_manager(self):
+        # A lagging replica could re-cache a deactivated user as active for
+        # the whole timeout
+        return self.user_model.objects.db_manager(DEFAULT_DB_ALIAS)
+
+    def get_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        cache = get_user_cache()
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            try:
+                user = self.get_user_manager().get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, user, getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 300))
+        return self.check_user(user, validated_token)
+
+    async def aget_user(self, validated_token):
+        """Async version of get_user for async views"""
+        user_id = self.get_user_id(validated_token)
+        cache = get_user_cache()
+        key = user_cache_key(user_id)
+        user = await cache.aget(key)
+        if user is None:
+            try:
+                user = await self.get_user_manager().aget(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            await cache.aset(key, user, getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 300))
+        return self.check_user(user, validated_token)
+
+    async def aauthenticate(self, request):
+        """
+        Async version of authenticate. Token validation is CPU-only; the
+        user is resolved through the async cache and ORM.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
@@ -0,0 +1,52 @@
+import csv
+import json
+
+from rest_framework import serializers
+
+
+# Output columns and the queryset values they are read from
+EXPORT_FIELDS = [
+    ('id', 'id'),
+    ('title', 'title'),
+    ('description', 'description'),
+    ('status', 'status'),
+    ('user', 'user__username'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
+
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object that hands back what is written to it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset):
+    """
+    Yield one dict per task, formatted like TaskSerializer, reading the
+    queryset through a server-side cursor in chunks of CHUNK_SIZE rows.
+    """
+    datetime_field = serializers.DateTimeField()
+    names = [name for name, _ in EXPORT_FIELDS]
+    lookups = [lookup for _, lookup in EXPORT_FIELDS]
+    for values in queryset.values_list(*lookups).iterator(chunk_size=CHUNK_SIZE):
+        row = dict(zip(names, values))
+        row['created_at'] = datetime_field.to_representation(row['created_at'])
+        row['updated_at'] = datetime_field.to_representation(row['updated_at'])
+        yield row
+
+
+def iter_ndjson(queryset):
+    for row in iter_rows(queryset):
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def iter_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow([name for name, _ in EXPORT_FIELDS])
+    for row in iter_rows(queryset):
+        yield writer.writerow(row.values())
@@ -0,0 +1,73 @@
+import django_filters
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from .models import Task, TaskQuerySet
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """Comma-separated list of values"""
+
+
+class TaskFilterSet(django_filters.FilterSet):
+    """
+    Filters for the task list views. Each one narrows a scan of the
+    ``(user, ...)`` composite indexes on Task:
+
+    - ``status`` / ``status__in``: ``(user, status, created_at)``
+    - ``open``: the partial index over tasks that are not completed
+    - ``created_at_after`` / ``created_at_before``: ``(user, created_at)``
+    - ``updated_at_after`` / ``updated_at_before``: ``(user, updated_at)``
+    """
+    status__in = CharInFilter(field_name='status', lookup_expr='in')
+    open = django_filters.BooleanFilter(method='filter_open', label='Not completed')
+    created_at = django_filters.IsoDateTimeFromToRangeFilter()
+    updated_at = django_filters.IsoDateTimeFromToRangeFilter()
+
+    class Meta:
+        model = Task
+        fields = ['status']
+
+    def filter_open(self, queryset, name, value):
+        # Must match the partial index condition to use it
+        if value:
+            return queryset.exclude(status=TaskQuerySet.COMPLETED)
+        return queryset.filter(status=TaskQuerySet.COMPLETED)
+
+
+class TaskSearchFilter(BaseFilterBackend):
+    """
+    Full-text search over task title and description with ``?search=``,
+    served by the GIN index on the stored search vector
+    """
+    search_param = 'search'
+
+    def get_search_text(self, request):
+        return request.query_params.get(self.search_param, '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        text = self.get_search_text(request)
+        if not text:
+            return queryset
+        return queryset.search(text)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Full-text search over title and description.',
+            'schema': {'type': 'string'},
+        }]
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """
+    Ordering filter that ranks search results best match first unless the
+    client asks for another ordering
+    """
+    search_ordering = ['-search_rank', '-id']
+
+    def get_ordering(self, request, queryset, view):
+        if not request.query_params.get(self.ordering_param) and TaskSearchFilter().get_search_text(request):
+            return self.search_ordering
+        return super().get_ordering(request, queryset, view)
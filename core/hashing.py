@@ -0,0 +1,97 @@
+"""
+Password hashing on a bounded pool of threads.
+
+PBKDF2 is slow on purpose. Run inline, a burst of signups or logins keeps
+every request worker hashing and starves task traffic. The pooled hasher
+runs each hash on one of ``PASSWORD_HASHING_WORKERS`` threads; hashlib
+releases the GIL while hashing, so they use that many cores and no more.
+At most ``PASSWORD_HASHING_QUEUE`` more hashes wait for a thread. Beyond
+that the request fails at once with 429 and a ``Retry-After`` of
+``PASSWORD_HASHING_RETRY_AFTER`` seconds. The pool belongs to the process.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework import exceptions
+
+
+class HashingBusy(exceptions.Throttled):
+    default_detail = "Too many sign-ins and registrations in progress. Try again shortly."
+    default_code = 'hashing_busy'
+
+
+class HashingPool:
+    """
+    Thread pool that refuses work, instead of queueing it, once ``workers``
+    jobs run and ``queue`` more wait
+    """
+
+    def __init__(self, workers, queue, retry_after):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hashing')
+        self.slots = threading.BoundedSemaphore(workers + queue)
+        self.retry_after = retry_after
+
+    def submit(self, fn, *args, **kwargs):
+        if not self.slots.acquire(blocking=False):
+            raise HashingBusy(wait=self.retry_after)
+
+        def job():
+            # Freed before the result is set, so a caller may submit again
+            # as soon as it has the result
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.slots.release()
+
+        try:
+            return self.executor.submit(job)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def run(self, fn, *args, **kwargs):
+        return self.submit(fn, *args, **kwargs).result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HashingPool(
+                    getattr(settings, 'PASSWORD_HASHING_WORKERS', 2),
+                    getattr(settings, 'PASSWORD_HASHING_QUEUE', 8),
+                    getattr(settings, 'PASSWORD_HASHING_RETRY_AFTER', 1),
+                )
+    return _pool
+
+
+@receiver(setting_changed)
+def reset_pool(setting, **kwargs):
+    global _pool
+    if setting.startswith('PASSWORD_HASHING_') and _pool is not None:
+        with _pool_lock:
+            _pool.shutdown()
+            _pool = None
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2PasswordHasher hashing on the pool. It keeps the algorithm name,
+    so existing hashes verify and new ones are interchangeable with it.
+    Verifying a password hashes it too.
+    """
+
+    def encode(self, password, salt, iterations=None):
+        return get_pool().run(super().encode, password, salt, iterations)
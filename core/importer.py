@@ -0,0 +1,211 @@
+import csv
+import io
+import json
+from collections import namedtuple
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+from .models import Task, TaskVersion
+from .serializers import StatusValidationMixin, TaskCreateSerializer
+
+
+ImportResult = namedtuple('ImportResult', ['imported', 'failed', 'errors'])
+
+FORMATS = ('csv', 'ndjson')
+
+
+def guess_format(filename):
+    """Pick the import format from a file name, defaulting to CSV"""
+    if filename and filename.lower().endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'csv'
+
+
+class ImportFileError(ValueError):
+    """
+    The file could not be read as a whole, rather than a row of it being
+    invalid
+    """
+
+
+class RowValidator(StatusValidationMixin):
+    """
+    Validate imported rows with the same rules as TaskCreateSerializer
+    without building a serializer per row: its title and description
+    fields are built once and run on each row
+    """
+    default_status = Task._meta.get_field('status').default
+
+    def __init__(self):
+        fields = TaskCreateSerializer().fields
+        self.title_field = fields['title']
+        self.description_field = fields['description']
+
+    def validate(self, data):
+        errors = {}
+        # As in the API, NUL characters, which COPY cannot store, and lone
+        # surrogates, which cannot be encoded, fail the row
+        try:
+            title = self.title_field.run_validation(data.get('title', empty))
+        except serializers.ValidationError as exc:
+            errors['title'] = exc.detail
+
+        try:
+            description = self.description_field.run_validation(data.get('description')) or None
+        except serializers.ValidationError as exc:
+            errors['description'] = exc.detail
+
+        status = data.get('status') or self.default_status
+        try:
+            self.validate_status(status)
+        except serializers.ValidationError as exc:
+            errors['status'] = exc.detail
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return title, description, status
+
+
+class RowStream(io.RawIOBase):
+    """Read-only file object over an iterator of text chunks, fed to COPY"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self.buffer:
+            try:
+                self.buffer = next(self.chunks).encode('utf-8')
+            except StopIteration:
+                return 0
+        size = min(len(target), len(self.buffer))
+        target[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+class TaskImporter:
+    """
+    Load tasks for one user from a CSV or NDJSON stream in a single
+    transaction. PostgreSQL uses COPY; other databases fall back to
+    bulk_create in batches of ``batch_size``. Invalid rows are skipped and
+    reported with their line numbers (at most ``max_errors`` of them). A
+    CSV file that cannot be parsed raises ImportFileError and imports
+    nothing.
+    """
+    columns = ('title', 'description', 'status', 'user_id', 'created_at', 'updated_at', 'version')
+
+    def __init__(self, user, batch_size=5000, max_errors=1000):
+        self.user = user
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.validator = RowValidator()
+
+    def parse(self, stream, fmt):
+        """Yield ``(line_number, row)`` pairs from a text stream"""
+        if fmt == 'csv':
+            reader = csv.DictReader(stream)
+            try:
+                for row in reader:
+                    yield reader.line_num, row
+            except csv.Error as exc:
+                # The reader cannot resync after a malformed record, such as
+                # a field over csv.field_size_limit(): the rest of a quoted
+                # field would be read as rows
+                raise ImportFileError(f"Line {reader.line_num + 1}: {exc}")
+            return
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None
+                continue
+            yield line_number, row
+
+    def valid_rows(self, stream, fmt):
+        # Formatted once: converting a datetime per row dominates COPY encoding
+        now = timezone.now().isoformat()
+        for line_number, row in self.parse(stream, fmt):
+            if not isinstance(row, dict):
+                self.report(line_number, {'non_field_errors': ['Invalid row.']})
+                continue
+            try:
+                title, description, status = self.validator.validate(row)
+            except serializers.ValidationError as exc:
+                self.report(line_number, exc.detail)
+                continue
+            self.imported += 1
+            yield title, description, status, self.user.pk, now, now
+
+    def report(self, line_number, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line_number, 'errors': errors})
+
+    def run(self, stream, fmt):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported import format: {fmt}")
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+        using = router.db_for_write(Task, instance=self.user)
+        connection = connections[using]
+        with transaction.atomic(using=using):
+            rows = self.valid_rows(stream, fmt)
+            if connection.vendor == 'postgresql':
+                # Bumped first, as every write does: the rows carry the
+                # version, and the user's other writes wait for the import
+                version = TaskVersion.objects.using(using).bump([self.user.pk])[self.user.pk]
+                self.copy(connection, rows, version)
+                if not self.imported:
+                    transaction.set_rollback(True, using=using)
+            else:
+                self.bulk_create(using, rows)
+        return ImportResult(self.imported, self.failed, self.errors)
+
+    def copy(self, connection, rows, version):
+        def chunks():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for count, row in enumerate(rows, start=1):
+                writer.writerow((*row, version))
+                if count % self.batch_size == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue()
+
+        table = connection.ops.quote_name(Task._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(column) for column in self.columns)
+        sql = f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+        with connection.cursor() as cursor:
+            if is_psycopg3:
+                with cursor.cursor.copy(sql) as copy:
+                    for chunk in chunks():
+                        copy.write(chunk)
+            else:
+                cursor.cursor.copy_expert(
+                    sql, io.BufferedReader(RowStream(chunks()), buffer_size=1 << 16)
+                )
+
+    def bulk_create(self, using, rows):
+        # auto_now_add/auto_now stamp the timestamps on insert
+        batch = []
+        for title, description, status, user_id, created_at, updated_at in rows:
+            batch.append(Task(title=title, description=description, status=status, user_id=user_id))
+            if len(batch) == self.batch_size:
+                Task.objects.using(using).bulk_create(batch)
+                batch = []
+        if batch:
+            Task.objects.using(using).bulk_create(batch)
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from core import partitions, sharding
+from core.models import Task, TaskQuerySet
+
+
+class Command(BaseCommand):
+    help = (
+        "Move tasks completed more than --completed-days ago to the archived "
+        "task table, in batches. With --detach-before, also detach the task "
+        "partitions of months before YYYY-MM whose tasks are all completed, "
+        "instead of moving their rows; --drop drops them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--completed-days', type=int, default=180)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--detach-before', metavar='YYYY-MM')
+        parser.add_argument('--drop', action='store_true')
+
+    def handle(self, *args, **options):
+        before = None
+        if options['detach_before']:
+            try:
+                before = datetime.strptime(options['detach_before'], '%Y-%m').replace(tzinfo=dt_timezone.utc)
+            except ValueError:
+                raise CommandError("--detach-before must be a month as YYYY-MM")
+        elif options['drop']:
+            raise CommandError("--drop needs --detach-before")
+
+        cutoff = timezone.now() - timedelta(days=options['completed_days'])
+        for shard in sharding.get_shards():
+            if before is not None:
+                self.detach(shard, before, options['drop'])
+            archived = (
+                Task.objects.using(shard)
+                .filter(status=TaskQuerySet.COMPLETED, updated_at__lt=cutoff)
+                .archive(batch_size=options['batch_size'])
+            )
+            self.stdout.write(f"{shard}: archived {archived} tasks")
+
+    def detach(self, shard, before, drop):
+        connection = connections[shard]
+        if not partitions.is_partitioned(connection):
+            self.stderr.write(f"{shard}: the task table is not partitioned")
+            return
+        for name in partitions.list_partitions(connection):
+            month = partitions.partition_month(name)
+            if month is None or month >= before:
+                continue
+            tasks = partitions.detach_partition(connection, name, drop=drop)
+            if tasks is None:
+                self.stderr.write(f"{shard}: {name} has open tasks and stays attached")
+            else:
+                self.stdout.write(f"{shard}: {'dropped' if drop else 'detached'} {name} with {tasks} tasks")
@@ -0,0 +1,57 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the database latency of a request with a new connection "
+        "against the configured DB_CONNECTION_MODE"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def measure(self, cycle, requests):
+        cycle()
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            cycle()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+
+        def new_connection():
+            # What every request paid before connections were reused
+            raw = connection.Database.connect(**connection.get_connection_params())
+            try:
+                with raw.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                raw.close()
+
+        def configured():
+            # The request signals open, recycle or return the connection
+            request_started.send(sender=self.__class__)
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                request_finished.send(sender=self.__class__)
+
+        mode = getattr(settings, 'DB_CONNECTION_MODE', 'off')
+        self.stdout.write(f"{'connection':>22} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8}")
+        for label, cycle in (('new per request', new_connection), (mode, configured)):
+            timings = sorted(self.measure(cycle, options['requests']))
+            self.stdout.write(
+                f"{label:>22} {statistics.mean(timings):>8.3f} "
+                f"{timings[len(timings) // 2]:>8.3f} {timings[int(len(timings) * 0.95)]:>8.3f}"
+            )
@@ -0,0 +1,67 @@
+import timeit
+from collections import namedtuple
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.models import CustomUser, Task
+from core.serializers import TaskSerializer, TaskValuesSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare TaskSerializer with the TaskValuesSerializer fast path per row"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def build(self, size):
+        """
+        In-memory tasks and the values_list() rows they would be read as,
+        so only serialization is measured
+        """
+        fast = TaskValuesSerializer()
+        Row = namedtuple('Row', fast.get_columns())
+        owner = CustomUser(id=1, username='bench')
+        now = timezone.now()
+        tasks, rows = [], []
+        for i in range(size):
+            task = Task(
+                id=i + 1,
+                title=f'Task {i}',
+                description='Lorem ipsum dolor sit amet ' * 4 if i % 2 else None,
+                status=('New', 'In Progress', 'Completed')[i % 3],
+                user=owner,
+                created_at=now - timedelta(minutes=i),
+                updated_at=now - timedelta(seconds=i, microseconds=i),
+            )
+            tasks.append(task)
+            values = {column: getattr(task, column) for column in Row._fields if column != 'user__username'}
+            rows.append(Row(user__username=owner.username, **values))
+        return tasks, rows
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        self.stdout.write(f"{'rows':>6} {'serializer us/row':>18} {'fast path us/row':>17} {'speedup':>8}")
+        for size in options['sizes']:
+            tasks, rows = self.build(size)
+
+            def slow():
+                return TaskSerializer(tasks, many=True).data
+
+            def fast():
+                return TaskValuesSerializer().to_representation(rows)
+
+            if renderer.render(slow()) != renderer.render(fast()):
+                raise CommandError(f"Outputs differ for {size} rows")
+
+            number = max(1, 10000 // size)
+            slow_time = min(timeit.repeat(slow, number=number, repeat=options['repeat']))
+            fast_time = min(timeit.repeat(fast, number=number, repeat=options['repeat']))
+            per_row = 1e6 / (number * size)
+            self.stdout.write(
+                f"{size:>6} {slow_time * per_row:>18.2f} {fast_time * per_row:>17.2f} "
+                f"{slow_time / fast_time:>7.1f}x"
+            )
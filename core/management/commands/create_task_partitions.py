@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from core import partitions, sharding
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly task partitions from the current month to "
+        "--months-ahead months later on every task shard. Run it monthly, "
+        "so new tasks never fall into the default partition."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        for shard in sharding.get_shards():
+            connection = connections[shard]
+            if not partitions.is_partitioned(connection):
+                self.stderr.write(f"{shard}: the task table is not partitioned")
+                continue
+            created = partitions.ensure_partitions(connection, now, options['months_ahead'])
+            self.stdout.write(f"{shard}: created {', '.join(created) or 'no partitions'}")
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete users, removing their tasks in batches with progress, so "
+        "memory use does not grow with the number of tasks"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='+')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = list(User.objects.filter(username__in=options['usernames']))
+        missing = set(options['usernames']) - {user.username for user in users}
+        if missing:
+            raise CommandError(f"Users do not exist: {', '.join(sorted(missing))}")
+
+        for user in users:
+            for model, deleted in user.delete_tasks(batch_size=options['batch_size']):
+                self.stdout.write(f"{user.username}: deleted {deleted} {model._meta.verbose_name_plural.lower()}")
+            user.delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {user.username}"))
@@ -0,0 +1,45 @@
+import sys
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.importer import FORMATS, ImportFileError, TaskImporter, guess_format
+
+
+class Command(BaseCommand):
+    help = "Import tasks for a user from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or NDJSON file, '-' for stdin")
+        parser.add_argument('--user', required=True, help="Username that will own the tasks")
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension")
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist")
+
+        path = options['path']
+        fmt = options['format'] or guess_format(path)
+        importer = TaskImporter(user, batch_size=options['batch_size'])
+        started = time.monotonic()
+        try:
+            if path == '-':
+                result = importer.run(sys.stdin, fmt)
+            else:
+                with open(path, encoding='utf-8', newline='') as stream:
+                    result = importer.run(stream, fmt)
+        except ImportFileError as exc:
+            raise CommandError(f"Nothing imported. {exc}")
+        elapsed = time.monotonic() - started
+
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.imported} tasks for {user.username} in {elapsed:.2f}s "
+            f"({result.failed} rows failed)"
+        ))
@@ -0,0 +1,49 @@
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Max
+
+from core import sharding
+from core.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy every user to the task shards and interleave task ids across "
+        "shards, so a task id is unique on all of them. Run after migrate."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        shards = sharding.get_shards()
+        if not sharding.is_sharded():
+            raise CommandError("TASK_SHARD_DATABASES is not set")
+
+        User = get_user_model()
+        for shard in sharding.get_remote_shards():
+            users = User.objects.using(DEFAULT_DB_ALIAS).order_by('pk').iterator(chunk_size=options['batch_size'])
+            copied = 0
+            while batch := list(islice(users, options['batch_size'])):
+                sharding.copy_users(batch, shard)
+                copied += len(batch)
+            self.stdout.write(f"{shard}: copied {copied} users")
+
+        for index, shard in enumerate(shards):
+            connection = connections[shard]
+            if connection.vendor != 'postgresql':
+                self.stderr.write(f"{shard}: task ids are only interleaved on PostgreSQL")
+                continue
+            # Shard i of n hands out the ids congruent to i + 1 modulo n
+            latest = Task.objects.using(shard).aggregate(latest=Max('id'))['latest'] or 0
+            start = latest + 1 + (index - latest) % len(shards)
+            with connection.cursor() as cursor:
+                # The partitioned task table takes ids from an owned sequence
+                cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [Task._meta.db_table])
+                sequence = cursor.fetchone()[0]
+                cursor.execute(f'ALTER SEQUENCE {sequence} INCREMENT BY {len(shards)} RESTART WITH {start}')
+            self.stdout.write(f"{shard}: next task id {start}, step {len(shards)}")
+        self.stdout.write(self.style.SUCCESS(f"Prepared {len(shards)} task shards"))
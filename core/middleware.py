@@ -0,0 +1,71 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from . import routers
+from .hashing import HashingBusy
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Scopes PrimaryReplicaRouter to each request. Safe requests read from a
+    replica; unsafe ones, and requests from a client or user that wrote in
+    the last ``REPLICA_PIN_SECONDS``, read from the primary. Clients are
+    recognised by the ``REPLICA_PIN_COOKIE`` cookie, API users by a cache
+    entry, since token clients rarely keep cookies.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def get_cookie_name(self):
+        return getattr(settings, 'REPLICA_PIN_COOKIE', 'db_pin')
+
+    def is_pinned(self, request):
+        return request.method not in SAFE_METHODS or self.get_cookie_name() in request.COOKIES
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with routers.routing(request, self.is_pinned(request)) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            self.pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        with routers.routing(request, self.is_pinned(request)) as state:
+            response = await self.get_response(request)
+        if state.wrote:
+            await sync_to_async(self.pin)(request, response)
+        return response
+
+    def pin(self, request, response):
+        seconds = routers.get_pin_seconds()
+        response.set_cookie(self.get_cookie_name(), '1', max_age=seconds, httponly=True, samesite='Lax')
+        user_id = routers.get_request_user_id(request)
+        if user_id is not None:
+            routers.pin_user(user_id)
+
+
+class HashingBusyMiddleware(MiddlewareMixin):
+    """
+    Answers 429 when the password hashing pool turns away a request outside
+    the API, such as an admin login; API views handle HashingBusy themselves
+    """
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, HashingBusy):
+            return None
+        response = HttpResponse(str(exception.detail), status=429, content_type='text/plain')
+        response['Retry-After'] = str(exception.wait)
+        return response
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_task_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_version', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('version', models.PositiveBigIntegerField(default=1)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Task Version',
+                'verbose_name_plural': 'Task Versions',
+            },
+        ),
+    ]
@@ -0,0 +1,115 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Statement-level triggers read the changed rows from transition tables, so
+# a bulk write or COPY updates each owner's counter row once, not per task.
+CHANGES = {
+    'insert': 'SELECT "user_id", "status", 1 AS "n" FROM new_rows',
+    'delete': 'SELECT "user_id", "status", -1 AS "n" FROM old_rows',
+    'update': (
+        'SELECT "user_id", "status", 1 AS "n" FROM new_rows '
+        'UNION ALL SELECT "user_id", "status", -1 FROM old_rows'
+    ),
+}
+
+REFERENCING = {
+    'insert': 'NEW TABLE AS new_rows',
+    'delete': 'OLD TABLE AS old_rows',
+    'update': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+}
+
+# Rows moved to another owner may need a counter row for that owner
+ENSURE_ROWS = """
+    INSERT INTO core_taskcounter ("user_id", "new", "in_progress", "completed")
+    SELECT DISTINCT "user_id", 0, 0, 0 FROM new_rows
+    ON CONFLICT ("user_id") DO NOTHING;
+"""
+
+TRIGGER = """
+CREATE FUNCTION core_task_count_{event}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    {ensure_rows}
+    UPDATE core_taskcounter AS counter SET
+        "new" = counter."new" + delta."new",
+        "in_progress" = counter."in_progress" + delta."in_progress",
+        "completed" = counter."completed" + delta."completed"
+    FROM (
+        SELECT "user_id",
+            coalesce(sum("n") FILTER (WHERE "status" = 'New'), 0) AS "new",
+            coalesce(sum("n") FILTER (WHERE "status" = 'In Progress'), 0) AS "in_progress",
+            coalesce(sum("n") FILTER (WHERE "status" = 'Completed'), 0) AS "completed"
+        FROM ({changes}) AS changes
+        GROUP BY "user_id"
+    ) AS delta
+    WHERE counter."user_id" = delta."user_id"
+        AND (delta."new", delta."in_progress", delta."completed") <> (0, 0, 0);
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER core_task_count_{event} AFTER {event} ON core_task
+    REFERENCING {referencing}
+    FOR EACH STATEMENT EXECUTE FUNCTION core_task_count_{event}();
+"""
+
+BACKFILL = """
+INSERT INTO core_taskcounter ("user_id", "new", "in_progress", "completed")
+SELECT "user_id",
+    count(*) FILTER (WHERE "status" = 'New'),
+    count(*) FILTER (WHERE "status" = 'In Progress'),
+    count(*) FILTER (WHERE "status" = 'Completed')
+FROM core_task
+GROUP BY "user_id";
+"""
+
+
+def create_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # Hold off task writes until the counters are backfilled
+    schema_editor.execute('LOCK TABLE core_task IN SHARE MODE')
+    for event in CHANGES:
+        schema_editor.execute(TRIGGER.format(
+            event=event,
+            changes=CHANGES[event],
+            referencing=REFERENCING[event],
+            ensure_rows='' if event == 'delete' else ENSURE_ROWS,
+        ))
+    schema_editor.execute(BACKFILL)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for event in CHANGES:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS core_task_count_{event} ON core_task')
+        schema_editor.execute(f'DROP FUNCTION IF EXISTS core_task_count_{event}()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_task_global_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('new', models.BigIntegerField(default=0)),
+                ('in_progress', models.BigIntegerField(default=0)),
+                ('completed', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Task Counter',
+                'verbose_name_plural': 'Task Counters',
+            },
+        ),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
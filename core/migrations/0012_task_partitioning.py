@@ -0,0 +1,127 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+from core import partitions
+
+
+# Months of empty partitions created ahead of the current one
+MONTHS_AHEAD = 3
+
+
+def partition_tasks(apps, schema_editor):
+    """
+    Rebuild core_task as a table partitioned by month of ``created_at``.
+    The table is locked and rewritten, so this takes as long as a copy of
+    every task. The primary key becomes (id, created_at), as PostgreSQL
+    requires the partition key in every unique constraint; ids still come
+    from one sequence and stay unique.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql' or partitions.is_partitioned(connection):
+        return
+    Task = apps.get_model('core', 'Task')
+    user = Task._meta.get_field('user')
+
+    schema_editor.execute('LOCK TABLE core_task IN ACCESS EXCLUSIVE MODE')
+    schema_editor.execute('ALTER TABLE core_task RENAME TO core_task_unpartitioned')
+    # Free the index names for the partitioned table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT index.relname FROM pg_index JOIN pg_class AS index ON index.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = 'core_task_unpartitioned'::regclass AND NOT pg_index.indisprimary
+            """
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT pg_get_serial_sequence('core_task_unpartitioned', 'id')")
+        old_sequence = cursor.fetchone()[0]
+        cursor.execute(f'SELECT last_value, is_called FROM {old_sequence}')
+        last_value, is_called = cursor.fetchone()
+        cursor.execute('SELECT seqincrement FROM pg_sequence WHERE seqrelid = %s::regclass', [old_sequence])
+        increment = cursor.fetchone()[0]
+        cursor.execute('SELECT min("created_at") FROM core_task_unpartitioned')
+        first = cursor.fetchone()[0]
+    for index in indexes:
+        schema_editor.execute(f'DROP INDEX {index}')
+    schema_editor.execute('ALTER INDEX core_task_pkey RENAME TO core_task_unpartitioned_pkey')
+
+    schema_editor.execute(
+        'CREATE TABLE core_task (LIKE core_task_unpartitioned INCLUDING DEFAULTS INCLUDING GENERATED) '
+        'PARTITION BY RANGE ("created_at")'
+    )
+    # Partitioned tables cannot have identity columns
+    schema_editor.execute(f'CREATE SEQUENCE core_task_partitioned_id_seq AS bigint INCREMENT BY {increment}')
+    schema_editor.execute(
+        'SELECT setval(%s, %s, %s)', params=['core_task_partitioned_id_seq', last_value, is_called]
+    )
+    schema_editor.execute(
+        "ALTER TABLE core_task ALTER COLUMN \"id\" SET DEFAULT nextval('core_task_partitioned_id_seq')"
+    )
+    schema_editor.execute('ALTER SEQUENCE core_task_partitioned_id_seq OWNED BY core_task."id"')
+    schema_editor.execute('ALTER TABLE core_task ADD CONSTRAINT core_task_pkey PRIMARY KEY ("id", "created_at")')
+    schema_editor.execute(schema_editor._create_fk_sql(Task, user, '_fk_%(to_table)s_%(to_column)s'))
+    schema_editor.execute(schema_editor._create_index_sql(Task, fields=[user]))
+    for index in Task._meta.indexes:
+        schema_editor.add_index(Task, index)
+
+    now = timezone.now()
+    first = partitions.month_start(first or now)
+    months = (now.year - first.year) * 12 + now.month - first.month
+    partitions.ensure_partitions(connection, first, months + MONTHS_AHEAD)
+    partitions.create_default_partition(connection)
+
+    with connection.cursor() as cursor:
+        columns = partitions.get_columns(cursor)
+    schema_editor.execute(
+        f'INSERT INTO core_task ({columns}) SELECT {columns} FROM core_task_unpartitioned'
+    )
+    # Takes the old triggers along; the functions are kept
+    schema_editor.execute('DROP TABLE core_task_unpartitioned')
+    schema_editor.execute('ALTER SEQUENCE core_task_partitioned_id_seq RENAME TO core_task_id_seq')
+    # Statement triggers on the parent see rows of every partition
+    for event, referencing in (
+        ('insert', 'NEW TABLE AS new_rows'),
+        ('update', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+        ('delete', 'OLD TABLE AS old_rows'),
+    ):
+        schema_editor.execute(
+            f'CREATE TRIGGER core_task_count_{event} AFTER {event} ON core_task '
+            f'REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION core_task_count_{event}()'
+        )
+    schema_editor.execute('ANALYZE core_task')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_task_updated_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='Task ID')),
+                ('title', models.CharField(max_length=255, verbose_name='Title')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Description')),
+                ('status', models.CharField(choices=[('New', 'New'), ('In Progress', 'In Progress'), ('Completed', 'Completed')], max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_tasks', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Archived Task',
+                'verbose_name_plural': 'Archived Tasks',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at', '-id'], name='archived_user_created_idx')],
+            },
+        ),
+        # Unapplying keeps the partitioned table, which serves the earlier
+        # schema as well
+        migrations.RunPython(partition_tasks, migrations.RunPython.noop),
+    ]
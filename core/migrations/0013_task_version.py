@@ -0,0 +1,58 @@
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+from core import partitions
+
+
+TASK_VERSION_INDEX = models.Index(fields=['user', 'version', 'id'], name='task_user_version_idx')
+
+
+def add_task_version_index(apps, schema_editor):
+    partitions.add_index(schema_editor, apps.get_model('core', 'Task'), TASK_VERSION_INDEX)
+
+
+def remove_task_version_index(apps, schema_editor):
+    schema_editor.remove_index(apps.get_model('core', 'Task'), TASK_VERSION_INDEX)
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently, partition by partition, while tasks
+    # stay writable. Existing rows keep version 0, before every change.
+    atomic = False
+
+    dependencies = [
+        ('core', '0012_task_partitioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='version',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tasktombstone',
+            name='version',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='task', index=TASK_VERSION_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_task_version_index, remove_task_version_index),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_user_updated_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='tasktombstone',
+            index=models.Index(fields=['user', 'version', 'id'], name='tombstone_user_version_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='tasktombstone',
+            name='tombstone_user_deleted_idx',
+        ),
+    ]
@@ -1,10 +1,16 @@
 
+from asgiref.sync import sync_to_async
 from django.db import models
 
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.db import DEFAULT_DB_ALIAS, connections, models, router, transaction
 from django.core.validators import MinLengthValidator
 from django.conf import settings
+from django.utils import timezone
+
+from . import sharding
 
 
 class CustomUser(AbstractUser):
@@ -26,11 +32,291 @@ class CustomUser(AbstractUser):
     def __str__(self):
         return self.username
 
+    def delete_tasks(self, batch_size=1000):
+        """
+        Delete the task rows the user owns, a batch per transaction, yielding
+        ``(model, deleted so far)`` after each batch. Memory use and lock
+        time stay bounded however many tasks the user has.
+        """
+        for model in (Task, ArchivedTask, TaskTombstone):
+            for deleted in model.objects.owned_by(self).delete_in_batches(batch_size):
+                if model is Task:
+                    # Staff listings of all tasks must not keep serving them
+                    TaskVersion.objects.on_shard_of(self.pk).bump_global()
+                yield model, deleted
+
+    def delete(self, *args, **kwargs):
+        # Deleted up front, the collector has no tasks left to cascade to
+        # in one statement
+        counts = {}
+        for model, deleted in self.delete_tasks():
+            counts[model._meta.label] = deleted
+        total, per_model = super().delete(*args, **kwargs)
+        for label, deleted in counts.items():
+            per_model[label] = per_model.get(label, 0) + deleted
+        return total + sum(counts.values()), per_model
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
 
 
+class WriteQuerySet(models.QuerySet):
+
+    def write_db(self):
+        """
+        Mark the queryset as writing, as QuerySet.update() does, and return
+        its database. Write paths that open a transaction or run raw SQL
+        use it, so they and the reads inside them go where the router sends
+        writes rather than to a replica.
+        """
+        self._for_write = True
+        return self.db
+
+
+class UserShardedQuerySet(WriteQuerySet):
+    """
+    QuerySet of rows stored on the shard of the user they belong to (see
+    core.sharding). Queries scoped to a user carry a routing hint, and
+    writes of many rows are split by shard.
+    """
+
+    def on_shard_of(self, user_id):
+        """Route the queryset to the shard holding the user's rows"""
+        clone = self._chain()
+        clone._hints = {**clone._hints, 'user_id': user_id}
+        return clone
+
+    def owned_by(self, user):
+        return self.on_shard_of(user.pk).filter(user=user)
+
+    def delete_in_batches(self, batch_size=1000):
+        """
+        Delete the matching rows, a batch per transaction, yielding the
+        number deleted so far after each batch. Rows are deleted by a plain
+        DELETE, without the model's delete() bookkeeping such as tombstones.
+        """
+        db = self.write_db()
+        deleted = 0
+        while True:
+            with transaction.atomic(using=db):
+                ids = list(self.order_by().values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    return
+                models.QuerySet.delete(self.filter(pk__in=ids))
+            deleted += len(ids)
+            yield deleted
+
+    def split_by_shard(self, objs):
+        """
+        Return ``{shard: objs}`` grouping objs by the shard of their user,
+        or None when the queryset's database is already decided
+        """
+        if self._db is not None or 'user_id' in self._hints or not sharding.is_sharded():
+            return None
+        groups = {}
+        for obj in objs:
+            groups.setdefault(sharding.shard_for_user(obj.user_id), []).append(obj)
+        return groups
+
+
+class TaskQuerySet(UserShardedQuerySet):
+    """
+    QuerySet with set-based write paths for tasks. Every write advances the
+    owners' collection version (see TaskVersion), so HTTP validators and
+    caches keyed by it never outlive the data they describe, and stamps
+    the rows it writes with it.
+    """
+    COMPLETED = 'Completed'
+
+    def owner_ids(self):
+        return list(self.order_by().values_list('user_id', flat=True).distinct())
+
+    def update(self, **kwargs):
+        kwargs.setdefault('updated_at', timezone.now())
+        db = self.write_db()
+        with transaction.atomic(using=db):
+            versions = TaskVersion.objects.using(db).bump(self.owner_ids())
+            if not versions:
+                return 0
+            kwargs['version'] = TaskVersion.objects.using(db).version_of(versions)
+            # Owners that appeared since are neither locked nor numbered
+            return super(TaskQuerySet, self.filter(user_id__in=versions)).update(**kwargs)
+
+    def delete(self):
+        db = self.write_db()
+        with transaction.atomic(using=db):
+            versions = TaskVersion.objects.using(db).bump(self.owner_ids())
+            if not versions:
+                return 0, {}
+            tasks = self.filter(user_id__in=versions)
+            # Set-based, so deleting millions of tasks never loads them
+            TaskTombstone.objects.using(db).record_from(tasks, versions)
+            return super(TaskQuerySet, tasks).delete()
+
+    def create(self, **kwargs):
+        # Route by the owner, as Model.save() does, not by the queryset
+        if self._db is None and 'user_id' not in self._hints:
+            user = kwargs.get('user')
+            user_id = user.pk if user is not None else kwargs.get('user_id')
+            if user_id is not None:
+                return self.on_shard_of(user_id).create(**kwargs)
+        return super().create(**kwargs)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        groups = self.split_by_shard(objs)
+        if groups is not None:
+            return [
+                obj for shard, group in groups.items()
+                for obj in self.using(shard).bulk_create(group, *args, **kwargs)
+            ]
+        db = self.write_db()
+        with transaction.atomic(using=db):
+            versions = TaskVersion.objects.using(db).bump(obj.user_id for obj in objs)
+            for obj in objs:
+                obj.version = versions[obj.user_id]
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        groups = self.split_by_shard(objs)
+        if groups is not None:
+            return sum(
+                self.using(shard).bulk_update(group, fields, *args, **kwargs) for shard, group in groups.items()
+            )
+        db = self.write_db()
+        with transaction.atomic(using=db):
+            versions = TaskVersion.objects.using(db).bump(obj.user_id for obj in objs)
+            for obj in objs:
+                obj.version = versions[obj.user_id]
+            return super().bulk_update(objs, [*fields, 'version'], *args, **kwargs)
+
+    def search(self, text):
+        """
+        Full-text search over title and description, matched against the
+        stored ``search_vector`` and annotated with ``search_rank``.
+        ``text`` uses web search syntax: quoted phrases, ``or`` and ``-``.
+        """
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+        return self.filter(search_vector=query).annotate(
+            search_rank=SearchRank(models.F('search_vector'), query)
+        )
+
+    def complete(self):
+        """
+        Mark every matching task that is not completed yet as completed
+        in a single UPDATE. Returns the number of tasks changed.
+        """
+        return self.exclude(status=self.COMPLETED).update(
+            status=self.COMPLETED, updated_at=timezone.now()
+        )
+
+    def complete_one(self, pk, user):
+        """
+        Complete one of the user's tasks and return it, or None if the user
+        has no such task. On PostgreSQL this is a single UPDATE ... RETURNING
+        statement that leaves already completed tasks untouched. The task is
+        only updated once the owner's version is advanced, so the version
+        row is locked before the task, as on every write path.
+        """
+        owned = self.owned_by(user)
+        db = owned.write_db()
+        connection = connections[db]
+        if connection.vendor != 'postgresql':
+            owned.filter(pk=pk).complete()
+            return owned.filter(pk=pk).first()
+
+        now = timezone.now()
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        version_table = connection.ops.quote_name(TaskVersion._meta.db_table)
+        names = [
+            connection.ops.quote_name(field.column)
+            for field in self.model._meta.concrete_fields
+            if not field.generated
+        ]
+        columns = ', '.join(names)
+        # Qualified: bumped has a "version" column too
+        returning = ', '.join(f'{table}.{name}' for name in names)
+        sql = f"""
+            WITH bumped AS (
+                INSERT INTO {version_table} ("user_id", "version", "changed_at")
+                SELECT %s, 1, %s WHERE EXISTS (
+                    SELECT 1 FROM {table} WHERE "id" = %s AND "user_id" = %s AND "status" <> %s
+                )
+                ON CONFLICT ("user_id") DO UPDATE
+                SET "version" = {version_table}."version" + 1, "changed_at" = EXCLUDED."changed_at"
+                RETURNING "version"
+            ), completed AS (
+                UPDATE {table} SET "status" = %s, "updated_at" = %s, "version" = bumped."version"
+                FROM bumped
+                WHERE "id" = %s AND "user_id" = %s AND "status" <> %s
+                RETURNING {returning}
+            )
+            SELECT {columns}, TRUE AS "was_completed" FROM completed
+            UNION ALL
+            SELECT {columns}, FALSE FROM {table}
+            WHERE "id" = %s AND "user_id" = %s AND NOT EXISTS (SELECT 1 FROM completed)
+        """
+        params = [
+            user.pk, now, pk, user.pk, self.COMPLETED,
+            self.COMPLETED, now, pk, user.pk, self.COMPLETED,
+            pk, user.pk,
+        ]
+        task = next(iter(self.model.objects.db_manager(db).raw(sql, params)), None)
+        if task is None:
+            return None
+        if task.was_completed:
+            TaskVersion.objects.using(db).bump_global()
+        task.user = user
+        return task
+
+    async def acomplete_one(self, pk, user):
+        # Several statements and a transaction hook, like QuerySet.aupdate()
+        return await sync_to_async(self.complete_one)(pk, user)
+
+    def archive(self, batch_size=1000):
+        """
+        Move the matching tasks to ArchivedTask, a batch per transaction, so
+        the task table keeps only the working set. Archived tasks leave the
+        API like deleted ones. Returns the number of tasks moved.
+        """
+        db = self.write_db()
+        fields = [field.attname for field in ArchivedTask._meta.concrete_fields if field.name != 'archived_at']
+        archived = 0
+        while True:
+            with transaction.atomic(using=db):
+                # Writers lock their owner's version before their tasks
+                TaskVersion.objects.using(db).lock(
+                    self.order_by('pk').values_list('user_id', flat=True)[:batch_size]
+                )
+                # Tasks locked by a writer are left for the next run
+                rows = list(
+                    self.order_by('pk').select_for_update(skip_locked=True).values_list(*fields)[:batch_size]
+                )
+                if not rows:
+                    return archived
+                ArchivedTask.objects.using(db).bulk_create(
+                    ArchivedTask(**dict(zip(fields, row))) for row in rows
+                )
+                self.model.objects.using(db).filter(pk__in=[row[0] for row in rows]).delete()
+            archived += len(rows)
+
+
+class TaskManager(models.Manager):
+    """
+    Leaves the stored search vector out of loaded tasks; it is only read
+    by the database when searching
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
+# Text search configuration of Task.search_vector and of search queries
+SEARCH_CONFIG = 'english'
+
+
 class Task(models.Model):
     """
     Task model with all required fields as per task requirements
@@ -57,11 +343,362 @@ class Task(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # The owner's TaskVersion.version as of the last write: delta sync's
+    # change number, which unlike updated_at follows commit order
+    version = models.BigIntegerField(default=0, editable=False)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = TaskManager.from_queryset(TaskQuerySet)()
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            # Composite indexes matching the list views: filter by user (and
+            # status), then sort by -created_at or title with an id tiebreaker
+            models.Index(fields=['user', '-created_at', '-id'], name='task_user_created_idx'),
+            models.Index(fields=['user', 'title', 'id'], name='task_user_title_idx'),
+            models.Index(fields=['user', 'status', '-created_at', '-id'], name='task_user_status_created_idx'),
+            models.Index(fields=['user', 'status', 'title', 'id'], name='task_user_status_title_idx'),
+            models.Index(fields=['-created_at', '-id'], name='task_created_idx'),
+            models.Index(fields=['user', 'version', 'id'], name='task_user_version_idx'),
+            models.Index(fields=['updated_at', 'id'], name='task_updated_idx'),
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                name='task_user_open_idx',
+                condition=~models.Q(status='Completed'),
+            ),
+            # Per-user search needs btree_gin for the user column
+            GinIndex(fields=['user', 'search_vector'], name='task_user_search_idx'),
+            GinIndex(fields=['search_vector'], name='task_search_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} - {self.user.username}"
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            self.version = TaskVersion.objects.using(using).bump([self.user_id])[self.user_id]
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = [*kwargs['update_fields'], 'version']
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get('using') or self._state.db
+        task_id = self.pk
+        with transaction.atomic(using=using):
+            versions = TaskVersion.objects.using(using).bump([self.user_id])
+            deleted = super().delete(*args, **kwargs)
+            TaskTombstone.objects.using(using).record([(task_id, self.user_id)], versions)
+        return deleted
+
+
+GLOBAL_VERSION_SEQUENCE = 'core_task_global_version'
+
+
+class TaskVersionQuerySet(UserShardedQuerySet):
+
+    def bump(self, user_ids):
+        """
+        Advance the task collection version of each user, and the global
+        version once the transaction commits. Returns ``{user_id: version}``.
+
+        The users' rows stay locked until the transaction ends, so each
+        user's versions follow commit order. Task rows and tombstones are
+        stamped with the version of the write that made them (see
+        version_of()), which makes it a change number for delta sync:
+        bump before writing them.
+        """
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return {}
+        self.bump_global()
+        now = timezone.now()
+        connection = connections[self.write_db()]
+        if connection.vendor == 'postgresql':
+            table = connection.ops.quote_name(self.model._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO {table} ("user_id", "version", "changed_at")
+                    SELECT unnest(%s::bigint[]), 1, %s
+                    ON CONFLICT ("user_id") DO UPDATE
+                    SET "version" = {table}."version" + 1, "changed_at" = EXCLUDED."changed_at"
+                    RETURNING "user_id", "version"
+                    """,
+                    [user_ids, now],
+                )
+                return dict(cursor.fetchall())
+        for user_id in user_ids:
+            if not self.filter(user_id=user_id).update(version=models.F('version') + 1, changed_at=now):
+                self.get_or_create(user_id=user_id, defaults={'changed_at': now})
+        return dict(self.filter(user_id__in=user_ids).values_list('user_id', 'version'))
+
+    def lock(self, user_ids):
+        """
+        Lock the users' rows as bump() does, without advancing them. Writes
+        that lock task rows before bumping take these locks first, so that
+        every writer locks a user's version before their tasks.
+        """
+        list(
+            self.filter(user_id__in=sorted(set(user_ids)))
+            .order_by('user_id').select_for_update().values_list('user_id', flat=True)
+        )
+
+    def version_of(self, versions):
+        """
+        Expression for the version of each written row, given the
+        ``{user_id: version}`` of bump()
+        """
+        if len(versions) == 1:
+            return models.Value(next(iter(versions.values())), output_field=models.BigIntegerField())
+        return models.Subquery(
+            self.filter(user_id=models.OuterRef('user_id')).values('version'),
+            output_field=models.BigIntegerField(),
+        )
+
+    def for_user(self, user):
+        """
+        Return ``(token, changed_at)`` for the user's task collection.
+        ``changed_at`` is None until the collection is first written.
+        """
+        row = self.owned_by(user).values_list('version', 'changed_at').first()
+        return self.make_token(row)
+
+    async def afor_user(self, user):
+        row = await self.owned_by(user).values_list('version', 'changed_at').afirst()
+        return self.make_token(row)
+
+    @staticmethod
+    def make_token(row):
+        if row is None:
+            return '0', None
+        version, changed_at = row
+        return f'{version}.{changed_at.timestamp():.6f}', changed_at
+
+    def bump_global(self):
+        """
+        Advance the version of the collection of all tasks. It is a
+        PostgreSQL sequence, so concurrent writers never wait on each other.
+        Inside a transaction it is advanced right away, so the transaction
+        reads its own writes, and again after commit, so other readers never
+        keep a version paired with data they could not see yet.
+        """
+        db = self.write_db()
+        connection = connections[db]
+        if connection.vendor != 'postgresql':
+            return
+
+        def advance():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT nextval(%s)", [GLOBAL_VERSION_SEQUENCE])
+
+        if connection.in_atomic_block:
+            advance()
+        transaction.on_commit(advance, using=db)
+
+    def global_version(self):
+        """
+        Return the token for the collection of all tasks, or None where
+        the database has no global version. Sharded, it combines the
+        version of the primary, advanced by user changes, and every shard.
+        It is read where it is written, never on a replica: a standby
+        only sees the sequence move when the primary WAL-logs it, every
+        32 values, so its copy lags and runs ahead of its data.
+        """
+        if self._db is None and sharding.is_sharded():
+            tokens = [self.using(db).global_version() for db in sharding.get_databases()]
+            return None if None in tokens else '.'.join(tokens)
+        # Not write_db(), which would pin the request to the primary
+        connection = connections[self._db or DEFAULT_DB_ALIAS]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT last_value, is_called FROM {GLOBAL_VERSION_SEQUENCE}")
+            last_value, is_called = cursor.fetchone()
+        return f'g{last_value if is_called else 0}'
+
+
+class TaskVersion(models.Model):
+    """
+    Per-user version of the task collection, advanced on every task write.
+    The tasks and tombstones a write leaves carry the version it set.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='task_version',
+        verbose_name="User"
+    )
+    version = models.PositiveBigIntegerField(default=1)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    objects = TaskVersionQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Task Version"
+        verbose_name_plural = "Task Versions"
+
+    def __str__(self):
+        return f"{self.user_id} v{self.version}"
+
+
+class TaskTombstoneQuerySet(UserShardedQuerySet):
+
+    def record(self, rows, versions):
+        """
+        Record deleted tasks given ``(task_id, user_id)`` pairs and the
+        ``{user_id: version}`` the owners were bumped to
+        """
+        now = timezone.now()
+        return self.bulk_create(
+            TaskTombstone(task_id=task_id, user_id=user_id, deleted_at=now, version=versions[user_id])
+            for task_id, user_id in rows
+        )
+
+    def record_from(self, tasks, versions):
+        """
+        Record the tasks of a queryset as deleted with a single
+        INSERT ... SELECT. Returns the number recorded.
+        """
+        db = self.write_db()
+        connection = connections[db]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        sql, params = (
+            tasks.order_by()
+            .annotate(deleted_version=TaskVersion.objects.using(db).version_of(versions))
+            .values_list('id', 'user_id', 'deleted_version')
+            .query.get_compiler(using=db).as_sql()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} ("task_id", "user_id", "deleted_at", "version") '
+                f'SELECT "id", "user_id", %s, "deleted_version" FROM ({sql}) AS deleted',
+                [connection.ops.adapt_datetimefield_value(timezone.now()), *params],
+            )
+            return cursor.rowcount
+
+
+class TaskTombstone(models.Model):
+    """
+    Marker left behind by a deleted task so that delta sync can report it
+    """
+    task_id = models.BigIntegerField(verbose_name="Task ID")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='task_tombstones',
+        verbose_name="User"
+    )
+    deleted_at = models.DateTimeField(default=timezone.now)
+    # The owner's TaskVersion.version as of the deletion (see Task.version)
+    version = models.BigIntegerField(default=0, editable=False)
+
+    objects = TaskTombstoneQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Task Tombstone"
+        verbose_name_plural = "Task Tombstones"
+        indexes = [
+            models.Index(fields=['user', 'version', 'id'], name='tombstone_user_version_idx'),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id} deleted at {self.deleted_at}"
+
+
+class TaskCounterQuerySet(UserShardedQuerySet):
+
+    def for_user(self, user):
+        """
+        Return the user's task counts by status. On PostgreSQL they are read
+        from the counter row, kept exact by triggers on the task table;
+        elsewhere they are counted.
+        """
+        owned = self.owned_by(user)
+        if connections[owned.db].vendor != 'postgresql':
+            counts = dict(
+                Task.objects.using(owned.db).filter(user=user)
+                .order_by().values_list('status').annotate(models.Count('id'))
+            )
+            return {status: counts.get(status, 0) for status in TaskCounter.FIELDS}
+        row = owned.values_list(*TaskCounter.FIELDS.values()).first()
+        return dict(zip(TaskCounter.FIELDS, row or (0,) * len(TaskCounter.FIELDS)))
+
+
+class TaskCounter(models.Model):
+    """
+    Per-user task counts by status. Maintained by statement-level triggers
+    on the task table, so every write path (ORM, raw SQL, COPY) keeps it
+    exact; see migration 0009.
+    """
+    # Task status -> counter column
+    FIELDS = {
+        'New': 'new',
+        'In Progress': 'in_progress',
+        'Completed': 'completed',
+    }
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='task_counter',
+        verbose_name="User"
+    )
+    new = models.BigIntegerField(default=0)
+    in_progress = models.BigIntegerField(default=0)
+    completed = models.BigIntegerField(default=0)
+
+    objects = TaskCounterQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Task Counter"
+        verbose_name_plural = "Task Counters"
+
+    def __str__(self):
+        return f"{self.user_id}: {self.new}/{self.in_progress}/{self.completed}"
+
+
+class ArchivedTask(models.Model):
+    """
+    Cold copy of a task moved out of the task table by
+    TaskQuerySet.archive(), keeping its id and timestamps. Archived tasks
+    are not served by the API.
+    """
+    id = models.BigIntegerField(primary_key=True, verbose_name="Task ID")
+    title = models.CharField(max_length=255, verbose_name="Title")
+    description = models.TextField(blank=True, null=True, verbose_name="Description")
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES, verbose_name="Status")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_tasks',
+        verbose_name="User"
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    objects = UserShardedQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Archived Task"
+        verbose_name_plural = "Archived Tasks"
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='archived_user_created_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.title} - {self.user.username}"
\ No newline at end of file
+        return f"{self.title} (archived)"
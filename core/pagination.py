@@ -0,0 +1,246 @@
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from functools import partial
+from urllib import parse
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .sharding import FanOutQuerySet
+
+
+Cursor = namedtuple('Cursor', ['position', 'pk', 'reverse'])
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset pagination over the view's ordering field with an ``id`` tiebreaker.
+
+    Each page is fetched with a range condition on ``(field, id)`` instead of
+    ``COUNT(*)`` and ``OFFSET``, so deep pages cost the same as the first one.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    default_ordering = '-created_at'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+
+        ordering = self.get_ordering(request, queryset, view)
+        self.field_name = ordering.lstrip('-')
+        self.model_field = queryset.model._meta.get_field(self.field_name)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        descending = ordering.startswith('-') != reverse
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{self.field_name}', f'{prefix}id')
+
+        if self.cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(self.cursor, descending))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Use the first field chosen by the view's ordering filter. Orderings
+        on annotations, such as search rank, have no stable cursor position
+        and fall back to the default.
+        """
+        fields = {field.name for field in queryset.model._meta.concrete_fields}
+        for backend in getattr(view, 'filter_backends', []):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering and ordering[0].lstrip('-') in fields:
+                    return ordering[0]
+        return self.default_ordering
+
+    def get_keyset_filter(self, cursor, descending):
+        """
+        Rows strictly after the cursor in ``(field, id)`` order.
+        The leading non-strict bound keeps the condition an index range scan.
+        """
+        name = self.field_name
+        if descending:
+            return Q(**{f'{name}__lte': cursor.position}) & (
+                Q(**{f'{name}__lt': cursor.position}) | Q(id__lt=cursor.pk)
+            )
+        return Q(**{f'{name}__gte': cursor.position}) & (
+            Q(**{f'{name}__gt': cursor.position}) | Q(id__gt=cursor.pk)
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            return Cursor(
+                position=tokens['p'][0],
+                pk=int(tokens['i'][0]),
+                reverse=bool(int(tokens.get('r', ['0'])[0])),
+            )
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        # Works for model instances and named values_list() rows alike
+        tokens = {
+            'p': self.model_field.value_to_string(obj),
+            'i': obj.id,
+        }
+        if reverse:
+            tokens['r'] = '1'
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'The pagination cursor value.',
+            'schema': {'type': 'string'},
+        }]
+
+
+class CountedPaginator(Paginator):
+    """
+    Paginator that takes the total from the caller, when it knows it,
+    instead of running ``COUNT(*)``
+    """
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            self.count = count
+
+
+def estimate_count(queryset):
+    """
+    The PostgreSQL planner's estimate of the number of rows of a queryset,
+    or None elsewhere. Unfiltered querysets read the table statistics,
+    summed over partitions; filtered ones the row estimate of their plan.
+    """
+    if isinstance(queryset, FanOutQuerySet):
+        estimates = [estimate_count(shard_queryset) for shard_queryset in queryset.querysets]
+        return None if None in estimates else sum(estimates)
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    if queryset.query.where:
+        plan = json.loads(queryset.order_by().explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+    with connection.cursor() as cursor:
+        # Tables never analyzed have reltuples -1
+        cursor.execute(
+            """
+            SELECT sum(greatest(pg_class.reltuples, 0)) FROM pg_partition_tree(%s) AS tree
+            JOIN pg_class ON pg_class.oid = tree.relid WHERE tree.isleaf
+            """,
+            [queryset.model._meta.db_table]
+        )
+        return int(cursor.fetchone()[0] or 0)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for very large tables: past ``exact_below`` rows it reports
+    the planner's estimate instead of running ``COUNT(*)``. Smaller or
+    unestimated results are counted exactly.
+    """
+    exact_below = 10000
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.exact_below:
+            return super().count
+        return estimate
+
+
+class TaskPagination(BasePagination):
+    """
+    Page-number pagination by default. Requests that pass a ``cursor``
+    query parameter (an empty value starts at the first page) are paginated
+    with ``TaskCursorPagination`` instead. Views with a ``get_list_count()``
+    method supply the page-number total themselves.
+    """
+    page_number_class = PageNumberPagination
+    cursor_class = TaskCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_class.cursor_query_param in request.query_params:
+            self.paginator = self.cursor_class()
+        else:
+            self.paginator = self.page_number_class()
+            count = view.get_list_count() if hasattr(view, 'get_list_count') else None
+            self.paginator.django_paginator_class = partial(CountedPaginator, count=count)
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return (
+            self.page_number_class().get_schema_operation_parameters(view)
+            + self.cursor_class().get_schema_operation_parameters(view)
+        )
@@ -0,0 +1,211 @@
+"""
+Monthly range partitions of the task table by ``created_at`` (PostgreSQL).
+
+Each month lives in ``core_task_pYYYY_MM``; rows outside every month land
+in ``core_task_default``. Partition indexes are named after the parent's,
+e.g. ``task_user_created_idx_p2026_10``. Whole months are retired with
+detach_partition() instead of deleting their rows.
+"""
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import transaction
+
+from .models import TaskCounter, TaskQuerySet, TaskVersion
+
+
+TABLE = 'core_task'
+DEFAULT_PARTITION = f'{TABLE}_default'
+PARTITION_NAME = re.compile(rf'^{TABLE}_p(\d{{4}})_(\d{{2}})$')
+INDEX_DEFINITION = re.compile(r'^(CREATE (?:UNIQUE )?INDEX) (\S+) ON (?:ONLY )?\S+ ')
+
+
+def month_start(value):
+    """The first instant of the month of ``value``, in UTC"""
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f'{TABLE}_p{month:%Y_%m}'
+
+
+def partition_month(name):
+    """The month a partition holds, or None for the default partition"""
+    match = PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match[1]), int(match[2]), 1, tzinfo=dt_timezone.utc)
+
+
+def literal(value):
+    return f"'{value.isoformat()}'"
+
+
+def is_partitioned(connection):
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def list_partitions(connection):
+    """Names of the attached partitions, oldest month first"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = %s::regclass",
+            [TABLE]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    return sorted(names, key=lambda name: (partition_month(name) is None, name))
+
+
+def get_columns(cursor):
+    """Stored columns of the task table; generated ones are computed"""
+    cursor.execute(
+        """
+        SELECT attname FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped AND attgenerated = ''
+        ORDER BY attnum
+        """,
+        [TABLE]
+    )
+    return ', '.join(f'"{row[0]}"' for row in cursor.fetchall())
+
+
+def create_table(cursor, name):
+    """
+    Create a table shaped like a partition, with the parent's indexes
+    under predictable names, so ATTACH PARTITION adopts them
+    """
+    suffix = name.removeprefix(f'{TABLE}_')
+    cursor.execute(f'CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING GENERATED)')
+    cursor.execute(f'ALTER TABLE {name} ADD CONSTRAINT {name}_pkey PRIMARY KEY ("id", "created_at")')
+    cursor.execute(
+        """
+        SELECT index.relname, pg_get_indexdef(index.oid)
+        FROM pg_index JOIN pg_class AS index ON index.oid = pg_index.indexrelid
+        WHERE pg_index.indrelid = %s::regclass AND NOT pg_index.indisprimary
+        """,
+        [TABLE]
+    )
+    for index, definition in cursor.fetchall():
+        cursor.execute(INDEX_DEFINITION.sub(rf'\1 {index}_{suffix} ON {name} ', definition))
+
+
+def add_index(schema_editor, model, index):
+    """
+    Add an index to the partitioned task table, for migrations that run
+    outside a transaction. Each partition's copy is built concurrently,
+    under the name create_table() would give it, and attached to the
+    parent's, so tasks stay writable while it builds.
+    """
+    connection = schema_editor.connection
+    if not is_partitioned(connection):
+        schema_editor.add_index(model, index)
+        return
+    statement = str(index.create_sql(model, schema_editor))
+    # Left invalid, and unused, until every partition's copy is attached
+    schema_editor.execute(INDEX_DEFINITION.sub(rf'\1 {index.name} ON ONLY {TABLE} ', statement))
+    for name in list_partitions(connection):
+        partition_index = f"{index.name}_{name.removeprefix(f'{TABLE}_')}"
+        schema_editor.execute(INDEX_DEFINITION.sub(rf'\1 CONCURRENTLY {partition_index} ON {name} ', statement))
+        schema_editor.execute(f'ALTER INDEX {index.name} ATTACH PARTITION {partition_index}')
+
+
+def create_partition(connection, month):
+    """
+    Create the partition of ``month`` unless it exists, moving the month's
+    rows out of the default partition. Returns whether it was created.
+    """
+    month = month_start(month)
+    name = partition_name(month)
+    if name in list_partitions(connection):
+        return False
+    start, end = literal(month), literal(add_months(month, 1))
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        create_table(cursor, name)
+        if DEFAULT_PARTITION in list_partitions(connection):
+            columns = get_columns(cursor)
+            in_month = f'"created_at" >= {start} AND "created_at" < {end}'
+            # Partitions have no triggers, so moving rows leaves the counters alone
+            cursor.execute(
+                f'INSERT INTO {name} ({columns}) SELECT {columns} FROM {DEFAULT_PARTITION} WHERE {in_month}'
+            )
+            cursor.execute(f'DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}')
+        cursor.execute(f'ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ({start}) TO ({end})')
+    return True
+
+
+def create_default_partition(connection):
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        create_table(cursor, DEFAULT_PARTITION)
+        cursor.execute(f'ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT')
+
+
+def ensure_partitions(connection, now, months_ahead):
+    """
+    Create the partitions from the month of ``now`` to ``months_ahead``
+    months later. Returns the names of those created.
+    """
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(month_start(now), offset)
+        if create_partition(connection, month):
+            created.append(partition_name(month))
+    return created
+
+
+def detach_partition(connection, name, drop=False):
+    """
+    Detach a partition whose tasks are all completed, leaving it as a
+    standalone table, or drop it. Its tasks leave the API like deleted
+    ones: counters are decremented, tombstones recorded and the owners'
+    versions advanced. Returns the number of tasks, or None if the
+    partition still holds open tasks.
+    """
+    counts = ', '.join(
+        f'count(*) FILTER (WHERE "status" = %s) AS "{column}"' for column in TaskCounter.FIELDS.values()
+    )
+    decrements = ', '.join(
+        f'"{column}" = counter."{column}" - removed."{column}"' for column in TaskCounter.FIELDS.values()
+    )
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # Writers lock their owner's version before their tasks; the
+        # tombstones are numbered with the bumped versions
+        cursor.execute(f'SELECT DISTINCT "user_id" FROM {name}')
+        TaskVersion.objects.using(connection.alias).bump(row[0] for row in cursor.fetchall())
+        cursor.execute(f'LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE')
+        cursor.execute(f'SELECT count(*) FROM {name} WHERE "status" <> %s', [TaskQuerySet.COMPLETED])
+        if cursor.fetchone()[0]:
+            transaction.set_rollback(True, using=connection.alias)
+            return None
+        cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+        # Detached rows must not block deleting their users
+        cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'", [name])
+        for (constraint,) in cursor.fetchall():
+            cursor.execute(f'ALTER TABLE {name} DROP CONSTRAINT "{constraint}"')
+        cursor.execute(
+            f"""
+            UPDATE core_taskcounter AS counter SET {decrements}
+            FROM (SELECT "user_id", {counts} FROM {name} GROUP BY "user_id") AS removed
+            WHERE counter."user_id" = removed."user_id"
+            """,
+            list(TaskCounter.FIELDS)
+        )
+        cursor.execute(
+            f'INSERT INTO core_tasktombstone ("task_id", "user_id", "deleted_at", "version") '
+            f'SELECT task."id", task."user_id", now(), version."version" FROM {name} AS task '
+            f'JOIN core_taskversion AS version ON version."user_id" = task."user_id"'
+        )
+        tasks = cursor.rowcount
+        if drop:
+            cursor.execute(f'DROP TABLE {name}')
+    return tasks
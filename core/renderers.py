@@ -0,0 +1,63 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed, producing
+    the same bytes as the stdlib encoder. datetimes are encoded natively;
+    other types go through DRF's encoder. Indented output and settings
+    orjson cannot match fall back to JSONRenderer.
+    """
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def use_orjson(self, accepted_media_type, renderer_context):
+        return (
+            orjson is not None
+            and self.ensure_ascii is False
+            and self.compact
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not self.use_orjson(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        # Escaped by JSONRenderer so the output is also valid JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON. Streaming views write their own rows; this
+    renderer only takes part in content negotiation and renders errors.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return JSONRenderer().render(data) + b'\n'
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Comma-separated values. Streaming views write their own rows; this
+    renderer only takes part in content negotiation and renders errors.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return JSONRenderer().render(data)
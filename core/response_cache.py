@@ -0,0 +1,71 @@
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for this process"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+
+    def record(self, hit):
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def snapshot(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+
+stats = CacheStats()
+
+
+def get_cache():
+    return caches[getattr(settings, 'TASK_LIST_CACHE_ALIAS', 'default')]
+
+
+def make_key(scope, version, request):
+    """
+    Key a cached list by its scope, the collection version and the full
+    URL. A write advances the version, so stale entries are never read
+    again and simply age out; nothing has to be deleted.
+    """
+    url = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+    return f'tasks:list:{scope}:{version}:{url}'
+
+
+def lookup(key):
+    data = get_cache().get(key)
+    stats.record(hit=data is not None)
+    return data
+
+
+def store(key, data):
+    get_cache().set(key, data, getattr(settings, 'TASK_LIST_CACHE_TIMEOUT', 300))
+
+
+async def alookup(key):
+    data = await get_cache().aget(key)
+    stats.record(hit=data is not None)
+    return data
+
+
+async def astore(key, data):
+    await get_cache().aset(key, data, getattr(settings, 'TASK_LIST_CACHE_TIMEOUT', 300))
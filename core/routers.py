@@ -0,0 +1,127 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject
+
+
+PIN_CACHE_KEY = 'db:pin:{}'
+
+_state = ContextVar('replica_routing', default=None)
+
+
+def get_replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def get_pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 10)
+
+
+def get_pin_cache():
+    return caches[getattr(settings, 'REPLICA_PIN_CACHE_ALIAS', 'default')]
+
+
+def pin_cache_key(user_id):
+    return PIN_CACHE_KEY.format(user_id)
+
+
+def pin_user(user_id):
+    """
+    Send the user's reads to the primary for ``REPLICA_PIN_SECONDS``, so
+    they see their own writes while the replicas catch up
+    """
+    get_pin_cache().set(pin_cache_key(user_id), True, get_pin_seconds())
+
+
+def get_request_user_id(request):
+    """
+    The id of the user the request was authenticated as so far, without
+    evaluating the lazy session user of AuthenticationMiddleware
+    """
+    user = request.__dict__.get('user')
+    if user is None or isinstance(user, SimpleLazyObject) or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+class RoutingState:
+    """
+    Routing of one request. Reads use a single replica for the whole
+    request, so the task collection version and the tasks it describes
+    come from the same copy of the data.
+    """
+
+    def __init__(self, request, pinned=False):
+        self.request = request
+        self.pinned = pinned
+        self.wrote = False
+        self.replica = None
+        self.checked_user_id = None
+
+    def is_pinned(self):
+        if self.pinned or self.wrote:
+            return True
+        # The user is only known once the view authenticated the request
+        user_id = get_request_user_id(self.request)
+        if user_id is not None and user_id != self.checked_user_id:
+            self.checked_user_id = user_id
+            self.pinned = bool(get_pin_cache().get(pin_cache_key(user_id)))
+        return self.pinned
+
+    def get_replica(self, replicas):
+        if self.replica not in replicas:
+            self.replica = random.choice(replicas)
+        return self.replica
+
+
+@contextmanager
+def routing(request, pinned=False):
+    """
+    Route the ORM queries made in the block as made for ``request``.
+    Outside of it every query goes to the primary.
+    """
+    state = RoutingState(request, pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends the reads of requests to one of ``DATABASE_REPLICAS`` and every
+    write to the primary. A request that writes, or whose client or user
+    wrote within ``REPLICA_PIN_SECONDS`` (see ReplicaRoutingMiddleware),
+    reads from the primary too. Queries made outside of requests, such
+    as management commands, always use the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replicas()
+        state = _state.get()
+        if not replicas or state is None or state.is_pinned():
+            return DEFAULT_DB_ALIAS
+        return state.get_replica(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas follow the primary's schema
+        if db in get_replicas():
+            return False
+        return None
@@ -1,5 +1,7 @@
 
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+from django.utils import timezone
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import authenticate
 from .models import Task, CustomUser
@@ -57,7 +59,21 @@ class StatusValidationMixin:
         return value
 
 
-class TaskSerializer(StatusValidationMixin, serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Mixin that keeps only the fields named in the ``fields`` serializer
+    context, when one is given
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get('fields')
+        if not requested:
+            return fields
+        return {name: field for name, field in fields.items() if name in requested}
+
+
+class TaskSerializer(SparseFieldsMixin, StatusValidationMixin, serializers.ModelSerializer):
     """
     Serializer for Task CRUD operations
     """
@@ -69,6 +85,93 @@ class TaskSerializer(StatusValidationMixin, serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
 
+def iso_datetime_converter(field):
+    """
+    DRF's ISO 8601 ``DateTimeField.to_representation`` with the timezone
+    looked up once instead of per value
+    """
+    tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+    def convert(value):
+        if tz is not None and timezone.is_aware(value):
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def get_converter(field):
+    """
+    Return a function producing what ``field.to_representation`` would for
+    a value read with ``values_list()``, or None where that is the value
+    itself
+    """
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        if isinstance(output_format, str) and output_format.lower() == ISO_8601:
+            return iso_datetime_converter(field)
+    if isinstance(field, (serializers.CharField, serializers.ChoiceField, serializers.IntegerField)):
+        # Columns are read as str/int already, and valid choices map to themselves
+        return None
+    if isinstance(field, serializers.StringRelatedField):
+        # Rendered by str(user), which is the username
+        return None
+    return field.to_representation
+
+
+class TaskValuesSerializer:
+    """
+    Read-only fast path of TaskSerializer for lists. Rows are read with
+    ``values_list()`` and every field goes through a converter chosen once
+    per list, so the output is the same as TaskSerializer's without its
+    per-field machinery. Honours the ``fields`` of sparse fieldsets.
+    """
+    # TaskSerializer field -> column it is read from
+    COLUMNS = {
+        'id': 'id',
+        'title': 'title',
+        'description': 'description',
+        'status': 'status',
+        'user': 'user__username',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    # Columns the cursor paginator reads from rows
+    CURSOR_COLUMNS = ['id', 'title', 'created_at', 'updated_at']
+
+    def __init__(self, fields=None):
+        serializer_fields = TaskSerializer().fields
+        self.fields = [
+            (name, self.COLUMNS[name], get_converter(serializer_fields[name]))
+            for name in TaskSerializer.Meta.fields
+            if fields is None or name in fields
+        ]
+
+    def get_columns(self):
+        columns = list(self.CURSOR_COLUMNS)
+        columns.extend(column for _, column, _ in self.fields if column not in columns)
+        return columns
+
+    def values(self, queryset):
+        """Named rows of the queryset holding the columns to serialize"""
+        return queryset.values_list(*self.get_columns(), named=True)
+
+    def to_representation(self, rows):
+        columns = self.get_columns()
+        fields = [(name, columns.index(column), convert) for name, column, convert in self.fields]
+        data = []
+        for row in rows:
+            item = {}
+            for name, index, convert in fields:
+                value = row[index]
+                # Like DRF, None is never passed to a converter
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
 class TaskCreateSerializer(StatusValidationMixin, serializers.ModelSerializer):
     """
     Serializer for creating tasks
@@ -84,4 +187,27 @@ class TaskUpdateSerializer(StatusValidationMixin, serializers.ModelSerializer):
     """
     class Meta:
         model = Task
-        fields = ['title', 'description', 'status']
\ No newline at end of file
+        fields = ['title', 'description', 'status']
+
+class BulkTaskSerializer(serializers.Serializer):
+    """
+    Serializer for the shape of bulk task requests.
+    Individual items are validated by the task serializers.
+    """
+    MAX_ITEMS = 1000
+
+    create = serializers.ListField(child=serializers.DictField(), required=False, max_length=MAX_ITEMS)
+    update = serializers.ListField(child=serializers.DictField(), required=False, max_length=MAX_ITEMS)
+    complete = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=MAX_ITEMS)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=MAX_ITEMS)
+
+    def validate_update(self, value):
+        for item in value:
+            if not isinstance(item.get('id'), int):
+                raise serializers.ValidationError("Every update must include an integer 'id'")
+        return value
+
+    def validate(self, attrs):
+        if not any(attrs.get(key) for key in ('create', 'update', 'complete', 'delete')):
+            raise serializers.ValidationError("Provide at least one of: create, update, complete, delete")
+        return attrs
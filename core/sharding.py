@@ -0,0 +1,330 @@
+import copy
+import heapq
+import zlib
+from itertools import islice
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count, F, Max, Min, Sum
+from django.db.models.expressions import OrderBy
+from django.db.models.query import (
+    FlatValuesListIterable,
+    NamedValuesListIterable,
+    QuerySet,
+    ValuesIterable,
+    ValuesListIterable,
+)
+
+
+# Models stored on the shard of the user they belong to
+SHARDED_MODELS = {
+    ('core', 'task'),
+    ('core', 'taskversion'),
+    ('core', 'tasktombstone'),
+    ('core', 'taskcounter'),
+    ('core', 'archivedtask'),
+}
+
+
+def get_shards():
+    """Database aliases holding tasks; just the primary unless sharded"""
+    return list(getattr(settings, 'TASK_SHARDS', None) or [DEFAULT_DB_ALIAS])
+
+
+def is_sharded():
+    return get_shards() != [DEFAULT_DB_ALIAS]
+
+
+def get_databases():
+    """The primary, which holds the users, and every shard"""
+    return list(dict.fromkeys([DEFAULT_DB_ALIAS, *get_shards()]))
+
+
+def get_remote_shards():
+    """Shards other than the primary; each keeps a copy of every user"""
+    return [shard for shard in get_shards() if shard != DEFAULT_DB_ALIAS]
+
+
+def shard_for_user(user_id):
+    """
+    The shard holding the user's tasks. CRC32 of the id is stable across
+    processes and Python versions, unlike hash(). Changing TASK_SHARDS
+    moves users, so existing tasks must be moved along with it.
+    """
+    shards = get_shards()
+    return shards[zlib.crc32(str(user_id).encode()) % len(shards)]
+
+
+def is_sharded_model(model):
+    return (model._meta.app_label, model._meta.model_name) in SHARDED_MODELS
+
+
+def get_user_id(hints):
+    """
+    The user whose shard a query belongs to: the ``user_id`` hint set by
+    UserShardedQuerySet.on_shard_of(), or the instance being saved or
+    related to, which is a task-like row or the user itself
+    """
+    if 'user_id' in hints:
+        return hints['user_id']
+    instance = hints.get('instance')
+    if instance is None:
+        return None
+    if instance._meta.label == settings.AUTH_USER_MODEL:
+        return instance.pk
+    return getattr(instance, 'user_id', None)
+
+
+def copy_users(users, shard):
+    """
+    Insert or update copies of users on a shard, so that its tasks can
+    reference and join them
+    """
+    users = [copy.copy(user) for user in users]
+    if not users:
+        return
+    model = type(users[0])
+    model._default_manager.using(shard).bulk_create(
+        users,
+        update_conflicts=True,
+        unique_fields=[model._meta.pk.name],
+        update_fields=[field.name for field in model._meta.concrete_fields if not field.primary_key],
+    )
+
+
+class ShardRouter:
+    """
+    Sends task rows to the shard of their user. Queries on the primary,
+    which includes every task query when unsharded, are left to the
+    routers after this one. Must come first in DATABASE_ROUTERS.
+    """
+
+    def get_shard(self, model, hints):
+        if not is_sharded_model(model):
+            return None
+        user_id = get_user_id(hints)
+        if user_id is None:
+            return None
+        shard = shard_for_user(user_id)
+        return None if shard == DEFAULT_DB_ALIAS else shard
+
+    def db_for_read(self, model, **hints):
+        return self.get_shard(model, hints)
+
+    def db_for_write(self, model, **hints):
+        return self.get_shard(model, hints)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Users are copied to every shard, so tasks may point at them
+        databases = {*get_databases(), *getattr(settings, 'DATABASE_REPLICAS', [])}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class Descending:
+    """Sort key wrapper reversing the order of a value"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def fan_out(queryset):
+    """
+    The queryset over every shard, or the queryset itself when unsharded
+    """
+    shards = get_shards()
+    if len(shards) == 1:
+        return queryset
+    return FanOutQuerySet([queryset.using(shard) for shard in shards])
+
+
+class FanOutQuerySet:
+    """
+    The same queryset on every shard, read as one. Chained queryset methods
+    are applied on each shard; rows are merge-sorted by the ordering, so a
+    slice ``[start:stop]`` reads at most ``stop`` rows from each shard.
+    Counts are summed and aggregates combined.
+    """
+
+    def __init__(self, querysets):
+        self.querysets = querysets
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        attr = getattr(self.querysets[0], name)
+        if not callable(attr):
+            return attr
+
+        def method(*args, **kwargs):
+            results = [getattr(queryset, name)(*args, **kwargs) for queryset in self.querysets]
+            if not all(isinstance(result, QuerySet) for result in results):
+                raise TypeError(f"QuerySet.{name}() cannot be combined across shards")
+            return FanOutQuerySet(results)
+        return method
+
+    def __repr__(self):
+        return f'<FanOutQuerySet {[queryset.db for queryset in self.querysets]}>'
+
+    # Orderings
+
+    def get_ordering(self):
+        queryset = self.querysets[0]
+        if queryset.query.order_by:
+            return list(queryset.query.order_by)
+        if queryset.query.default_ordering:
+            return list(queryset.model._meta.ordering)
+        return []
+
+    def get_sort_columns(self):
+        """``(name, descending)`` pairs of the ordering"""
+        columns = []
+        for term in self.get_ordering():
+            if isinstance(term, OrderBy) and isinstance(term.expression, F):
+                name, descending = term.expression.name, term.descending
+            elif isinstance(term, str) and term != '?':
+                name, descending = term.lstrip('-'), term.startswith('-')
+            else:
+                raise TypeError(f"Ordering by {term!r} cannot be merged across shards")
+            if name == 'pk':
+                name = self.querysets[0].model._meta.pk.attname
+            columns.append((name, descending))
+        return columns
+
+    def prepared(self):
+        """
+        The querysets to read, with the ordering columns added to values()
+        and values_list() rows that lack them
+        """
+        queryset = self.querysets[0]
+        fields = queryset._fields or ()
+        missing = [name for name, _ in self.get_sort_columns() if name not in fields]
+        iterable = queryset._iterable_class
+        if iterable is FlatValuesListIterable:
+            raise TypeError("Flat values_list() rows cannot be merged across shards")
+        if iterable is ValuesIterable:
+            if not missing or not fields:
+                return self.querysets
+            return [qs.values(*fields, *missing) for qs in self.querysets]
+        if iterable in (ValuesListIterable, NamedValuesListIterable):
+            # Tuples are merged by name; the extra columns come last
+            if missing or iterable is ValuesListIterable:
+                return [qs.values_list(*fields, *missing, named=True) for qs in self.querysets]
+        return self.querysets
+
+    def get_sort_key(self):
+        columns = self.get_sort_columns()
+
+        def value(row, name):
+            if isinstance(row, dict):
+                return row[name]
+            if hasattr(row, name):
+                return getattr(row, name)
+            for part in name.split('__'):
+                row = getattr(row, part)
+            return row
+
+        def key(row):
+            return tuple(
+                Descending(value(row, name)) if descending else value(row, name)
+                for name, descending in columns
+            )
+        return key
+
+    def merge(self, iterables):
+        return heapq.merge(*iterables, key=self.get_sort_key())
+
+    # Reading
+
+    def __iter__(self):
+        return self.merge(self.prepared())
+
+    def iterator(self, chunk_size=None):
+        return self.merge(queryset.iterator(chunk_size=chunk_size) for queryset in self.prepared())
+
+    def __getitem__(self, k):
+        if isinstance(k, int):
+            return list(self[k:k + 1])[0]
+        if k.step is not None or (k.start or 0) < 0 or (k.stop is not None and k.stop < 0):
+            raise ValueError("FanOutQuerySet only supports non-negative slices without a step")
+        if k.stop is None:
+            return list(islice(self, k.start, None))
+        rows = self.merge(queryset[:k.stop] for queryset in self.prepared())
+        return list(islice(rows, k.start, k.stop))
+
+    def __len__(self):
+        return self.count()
+
+    def __bool__(self):
+        return self.exists()
+
+    def count(self):
+        return sum(queryset.count() for queryset in self.querysets)
+
+    def exists(self):
+        return any(queryset.exists() for queryset in self.querysets)
+
+    def get(self, *args, **kwargs):
+        found = []
+        for queryset in self.querysets:
+            try:
+                found.append(queryset.get(*args, **kwargs))
+            except queryset.model.DoesNotExist:
+                pass
+        model = self.querysets[0].model
+        if not found:
+            raise model.DoesNotExist(f"{model._meta.object_name} matching query does not exist.")
+        if len(found) > 1:
+            raise model.MultipleObjectsReturned(
+                f"get() returned more than one {model._meta.object_name} across shards"
+            )
+        return found[0]
+
+    def aggregate(self, **kwargs):
+        combiners = {}
+        for name, expression in kwargs.items():
+            for kind, combine in ((Count, sum), (Sum, sum), (Min, min), (Max, max)):
+                if isinstance(expression, kind):
+                    combiners[name] = combine
+                    break
+            else:
+                raise TypeError("Only Count, Sum, Min and Max aggregate across shards")
+        results = [queryset.aggregate(**kwargs) for queryset in self.querysets]
+        combined = {}
+        for name, combine in combiners.items():
+            values = [result[name] for result in results if result[name] is not None]
+            combined[name] = combine(values) if values else None
+        return combined
+
+    def dates(self, field_name, kind, order='ASC'):
+        values = {value for queryset in self.querysets for value in queryset.dates(field_name, kind, order)}
+        return sorted(values, reverse=order == 'DESC')
+
+    def datetimes(self, field_name, kind, order='ASC', tzinfo=None):
+        values = {
+            value for queryset in self.querysets
+            for value in queryset.datetimes(field_name, kind, order, tzinfo)
+        }
+        return sorted(values, reverse=order == 'DESC')
+
+    # Writing
+
+    def update(self, **kwargs):
+        return sum(queryset.update(**kwargs) for queryset in self.querysets)
+
+    def delete(self):
+        total, counts = 0, {}
+        for queryset in self.querysets:
+            deleted, per_model = queryset.delete()
+            total += deleted
+            for label, count in per_model.items():
+                counts[label] = counts.get(label, 0) + count
+        return total, counts
@@ -0,0 +1,39 @@
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import sharding
+from .authentication import invalidate_cached_user
+from .models import CustomUser, TaskVersion
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    Drop saved, deactivated or deleted users from the auth cache once the
+    change commits; dropped earlier, a concurrent request could cache the
+    old row again for the whole timeout. A local-memory cache is only
+    cleared in this process.
+    """
+    transaction.on_commit(lambda: invalidate_cached_user(instance.pk), using=kwargs['using'])
+    # Usernames appear in every task listing
+    TaskVersion.objects.using(kwargs['using']).bump_global()
+
+
+@receiver(post_save, sender=CustomUser)
+def copy_user_to_shards(sender, instance, using, **kwargs):
+    """Keep each task shard's copy of the user in step with the primary"""
+    if using != DEFAULT_DB_ALIAS:
+        return
+    for shard in sharding.get_remote_shards():
+        sharding.copy_users([instance], shard)
+
+
+@receiver(post_delete, sender=CustomUser)
+def delete_user_from_shards(sender, instance, using, **kwargs):
+    """Delete the user's copies, and with them their tasks, on every shard"""
+    if using != DEFAULT_DB_ALIAS:
+        return
+    for shard in sharding.get_remote_shards():
+        CustomUser.objects.using(shard).filter(pk=instance.pk).delete()
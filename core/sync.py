@@ -0,0 +1,90 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from .models import Task, TaskTombstone, TaskVersion
+
+
+SyncCursor = namedtuple('SyncCursor', ['task_version', 'task_id', 'tombstone_version', 'tombstone_id'])
+ChangeSet = namedtuple('ChangeSet', ['tasks', 'deleted', 'cursor', 'has_more'])
+
+
+def encode_cursor(cursor):
+    querystring = parse.urlencode({
+        'v': cursor.task_version,
+        'i': cursor.task_id,
+        'd': cursor.tombstone_version,
+        't': cursor.tombstone_id,
+    })
+    return urlsafe_b64encode(querystring.encode('ascii')).decode('ascii')
+
+
+def decode_cursor(encoded):
+    try:
+        tokens = parse.parse_qs(urlsafe_b64decode(encoded.encode('ascii')).decode('ascii'))
+        return SyncCursor(
+            task_version=int(tokens['v'][0]),
+            task_id=int(tokens['i'][0]),
+            tombstone_version=int(tokens['d'][0]),
+            tombstone_id=int(tokens['t'][0]),
+        )
+    except (TypeError, ValueError, KeyError, UnicodeError):
+        raise ValidationError({'since': 'Invalid sync cursor'})
+
+
+def initial_cursor(user):
+    """
+    Cursor for a client without local state: every task is a change and
+    only deletions from now on are of interest, those numbered after the
+    user's current version.
+    """
+    version = TaskVersion.objects.owned_by(user).values_list('version', flat=True).first() or 0
+    return SyncCursor(task_version=0, task_id=0, tombstone_version=version + 1, tombstone_id=0)
+
+
+def after(field, position, pk):
+    """Rows strictly after ``(position, pk)`` in ``(field, id)`` order"""
+    return Q(**{f'{field}__gte': position}) & (
+        Q(**{f'{field}__gt': position}) | Q(id__gt=pk)
+    )
+
+
+def get_changes(user, cursor, limit):
+    """
+    Return tasks changed and tasks deleted after ``cursor``, at most
+    ``limit`` of each. Both are index range scans on ``(user, version, id)``.
+
+    Rows are ordered by the owner's version they were written at, not by
+    timestamp. A user's versions are handed out under a row lock held
+    until commit (see TaskVersionQuerySet.bump()), so a write that commits
+    after a sync always numbers its rows after that sync's cursor.
+    """
+    tasks = list(
+        Task.objects.owned_by(user)
+        .filter(after('version', cursor.task_version, cursor.task_id))
+        .select_related('user')
+        .order_by('version', 'id')[:limit + 1]
+    )
+    tombstones = list(
+        TaskTombstone.objects.owned_by(user)
+        .filter(after('version', cursor.tombstone_version, cursor.tombstone_id))
+        .order_by('version', 'id')
+        .values_list('id', 'task_id', 'version')[:limit + 1]
+    )
+    has_more = len(tasks) > limit or len(tombstones) > limit
+    tasks = tasks[:limit]
+    tombstones = tombstones[:limit]
+
+    if tasks:
+        cursor = cursor._replace(task_version=tasks[-1].version, task_id=tasks[-1].id)
+    if tombstones:
+        cursor = cursor._replace(tombstone_version=tombstones[-1][2], tombstone_id=tombstones[-1][0])
+    return ChangeSet(
+        tasks=tasks,
+        deleted=[task_id for _, task_id, _ in tombstones],
+        cursor=encode_cursor(cursor),
+        has_more=has_more,
+    )
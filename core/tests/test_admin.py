@@ -0,0 +1,126 @@
+import unittest
+from datetime import timedelta
+
+from django.contrib.admin import helpers
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import Task, TaskTombstone
+from core.pagination import EstimatedCountPaginator
+
+User = get_user_model()
+
+
+class TaskAdminTestCase(TestCase):
+    """Test the task changelist and its set-based actions"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', password='testpass123', first_name='Admin')
+        self.client.force_login(self.admin)
+        self.url = reverse('admin:core_task_changelist')
+        self.users = [
+            User.objects.create_user(username=f'owner{i}', password='testpass123', first_name='Owner')
+            for i in range(3)
+        ]
+
+    def create_tasks(self, count):
+        return Task.objects.bulk_create(
+            Task(title=f'Task {i}', user=self.users[i % len(self.users)]) for i in range(count)
+        )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_changelist_joins_owners(self):
+        self.create_tasks(1)
+        self.count_queries(self.url)
+        one = self.count_queries(self.url)
+        self.create_tasks(9)
+        self.assertEqual(self.count_queries(self.url), one)
+
+    def test_created_month_filter(self):
+        old, _ = self.create_tasks(2)
+        last_year = timezone.now() - timedelta(days=400)
+        Task.objects.filter(pk=old.pk).update(created_at=last_year)
+
+        response = self.client.get(self.url, {'created_month': f'{last_year:%Y-%m}'})
+        self.assertContains(response, f'{last_year:%B %Y}')
+        self.assertEqual(list(response.context['cl'].result_list), [Task.objects.get(pk=old.pk)])
+
+        response = self.client.get(self.url, {'created_month': 'soon'})
+        self.assertRedirects(response, f'{self.url}?e=1', fetch_redirect_response=False)
+
+    def post_action(self, action, tasks=(), **data):
+        return self.client.post(self.url, {
+            'action': action,
+            'index': 0,
+            helpers.ACTION_CHECKBOX_NAME: [task.pk for task in tasks],
+            **data,
+        })
+
+    def test_mark_completed(self):
+        tasks = self.create_tasks(4)
+        self.post_action('mark_completed', tasks[:3])
+        self.assertEqual(Task.objects.filter(status='Completed').count(), 3)
+
+        # Browsers post the checked rows along with select_across
+        self.post_action('mark_completed', tasks[:1], select_across='1')
+        self.assertFalse(Task.objects.exclude(status='Completed').exists())
+
+    def test_delete_tasks(self):
+        tasks = self.create_tasks(4)
+        response = self.post_action('delete_tasks', tasks[:2])
+        self.assertContains(response, 'delete 2 tasks')
+        self.assertEqual(Task.objects.count(), 4)
+
+        self.post_action('delete_tasks', tasks[:2], post='yes')
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(
+            set(TaskTombstone.objects.values_list('task_id', flat=True)),
+            {tasks[0].pk, tasks[1].pk}
+        )
+
+    def test_delete_tasks_across_selection(self):
+        tasks = self.create_tasks(3)
+        response = self.post_action('delete_tasks', tasks[:1], select_across='1')
+        self.assertContains(response, 'delete 3 tasks')
+        self.assertContains(response, f'name="{helpers.ACTION_CHECKBOX_NAME}" value="{tasks[0].pk}"')
+
+        # Post the confirmation form back as rendered
+        self.post_action('delete_tasks', tasks[:1], select_across='1', post='yes')
+        self.assertFalse(Task.objects.exists())
+        self.assertEqual(TaskTombstone.objects.count(), 3)
+
+    def test_delete_selected_is_replaced(self):
+        response = self.client.get(self.url)
+        actions = [name for name, _ in response.context['action_form'].fields['action'].choices]
+        self.assertNotIn('delete_selected', actions)
+        self.assertIn('delete_tasks', actions)
+
+
+class EstimatedCountPaginatorTestCase(TestCase):
+    """Test the estimated row counts of the admin paginator"""
+
+    def setUp(self):
+        user = User.objects.create_user(username='counted', password='testpass123', first_name='Counted')
+        Task.objects.bulk_create(Task(title=f'Task {i}', user=user) for i in range(5))
+
+    def test_small_results_are_counted(self):
+        self.assertEqual(EstimatedCountPaginator(Task.objects.all(), 2).count, 5)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'Estimates need PostgreSQL')
+    def test_large_results_are_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Task._meta.db_table}')
+        paginator = EstimatedCountPaginator(Task.objects.all(), 2)
+        paginator.exact_below = 0
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(paginator.count, 5)
+        self.assertNotIn('COUNT(', ' '.join(query['sql'] for query in ctx.captured_queries).upper())
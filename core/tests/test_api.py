@@ -1,6 +1,11 @@
 
+from core import routers
+from core.authentication import CachedJWTAuthentication
 from core.models import CustomUser, Task
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
@@ -219,6 +224,41 @@ class TaskAPITestCase(APITestCase):
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_mark_completed_task_is_noop(self):
+        """Test that completing a completed task does not write it again"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token2}')
+        url = reverse('task-complete', args=[self.task3.id])
+        updated_at = self.task3.updated_at
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['task']['status'], 'Completed')
+        self.task3.refresh_from_db()
+        self.assertEqual(self.task3.updated_at, updated_at)
+
+    def test_mark_task_completed_single_statement(self):
+        """Test that completion touches the task table in a single statement"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token1}')
+        url = reverse('task-complete', args=[self.task1.id])
+        self.client.post(reverse('task-complete', args=[self.task2.id]))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['task']['user'], 'testuser1')
+        task_table = Task._meta.db_table
+        self.assertEqual(len([q for q in ctx.captured_queries if f'"{task_table}"' in q['sql']]), 1)
+
+    def test_complete_matching_tasks(self):
+        """Test completing every task that matches a filter"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token1}')
+        url = reverse('task-complete-matching')
+        response = self.client.post(f'{url}?status=New')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['completed'], 1)
+        self.task1.refresh_from_db()
+        self.task2.refresh_from_db()
+        self.assertEqual(self.task1.status, 'Completed')
+        self.assertEqual(self.task2.status, 'In Progress')
+
     def test_filter_tasks_by_status(self):
         """Test filtering tasks by status"""
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token1}')
@@ -307,4 +347,220 @@ class JWTAuthenticationTestCase(APITestCase):
         refresh_data = {'refresh': refresh_token}
         response = self.client.post(self.refresh_url, refresh_data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('access', response.data)
\ No newline at end of file
+        self.assertIn('access', response.data)
+
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """Test that JWT users are served from the cache and invalidated on change"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='cacheduser',
+            password='testpass123',
+            first_name='Cached'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-list-create')
+
+    def user_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        user_table = CustomUser._meta.db_table
+        return response, [q for q in ctx.captured_queries if f'FROM "{user_table}"' in q['sql']]
+
+    def test_second_request_skips_user_query(self):
+        response, queries = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+
+        response, queries = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user_is_rejected(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_is_dropped_on_commit(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            # Until the change commits, the cached user is the committed one
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_cache_miss_reads_primary(self):
+        token = RefreshToken.for_user(self.user).access_token
+        # replica1 is not configured, so reading it would raise
+        with routers.routing(RequestFactory().get(self.url)):
+            user = CachedJWTAuthentication().get_user(token)
+        self.assertEqual(user, self.user)
+
+class TaskCursorPaginationTestCase(APITestCase):
+    """Test keyset (cursor) pagination of task lists"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='cursoruser',
+            password='testpass123',
+            first_name='Cursor'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.task_list_url = reverse('task-list-create')
+
+        # Identical timestamps force the id tiebreaker to be used
+        Task.objects.bulk_create(
+            Task(title=f'Task {i:02d}', status='New' if i % 2 else 'Completed', user=self.user)
+            for i in range(25)
+        )
+        Task.objects.filter(user=self.user, title__lt='Task 10').update(
+            created_at=Task.objects.filter(user=self.user).earliest('created_at').created_at
+        )
+
+    def walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids.extend(task['id'] for task in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_page_number_is_default(self):
+        response = self.client.get(self.task_list_url)
+        self.assertIn('count', response.data)
+
+    def test_cursor_walks_every_task_once(self):
+        ids = self.walk(f'{self.task_list_url}?cursor=')
+        expected = list(
+            Task.objects.filter(user=self.user)
+            .order_by('-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_cursor_with_status_filter_and_title_ordering(self):
+        ids = self.walk(f'{self.task_list_url}?cursor=&status=New&ordering=title')
+        expected = list(
+            Task.objects.filter(user=self.user, status='New')
+            .order_by('title', 'id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_previous_page(self):
+        first = self.client.get(f'{self.task_list_url}?cursor=')
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(back.data['results'], first.data['results'])
+        self.assertIsNone(back.data['previous'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'{self.task_list_url}?cursor=garbage')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskFilterTestCase(APITestCase):
+    """Test the task list filters"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='filteruser',
+            password='testpass123',
+            first_name='Filter'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-list-create')
+        self.new = Task.objects.create(title='New', status='New', user=self.user)
+        self.started = Task.objects.create(title='Started', status='In Progress', user=self.user)
+        self.done = Task.objects.create(title='Done', status='Completed', user=self.user)
+        Task.objects.filter(pk=self.new.pk).update(created_at='2026-01-01T00:00:00Z')
+        Task.objects.filter(pk=self.done.pk).update(updated_at='2026-01-01T00:00:00Z')
+
+    def filter(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {task['id'] for task in response.data['results']}
+
+    def test_status_in(self):
+        self.assertEqual(self.filter(status__in='New,Completed'), {self.new.id, self.done.id})
+
+    def test_open_shortcut(self):
+        self.assertEqual(self.filter(open='true'), {self.new.id, self.started.id})
+        self.assertEqual(self.filter(open='false'), {self.done.id})
+
+    def test_created_at_range(self):
+        self.assertEqual(self.filter(created_at_before='2026-02-01T00:00:00Z'), {self.new.id})
+        self.assertEqual(
+            self.filter(created_at_after='2026-02-01T00:00:00Z', open='true'),
+            {self.started.id}
+        )
+
+    def test_updated_at_range(self):
+        self.assertEqual(self.filter(updated_at_after='2026-02-01T00:00:00Z'), {self.new.id, self.started.id})
+
+    def test_invalid_range(self):
+        response = self.client.get(self.url, {'created_at_after': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskSparseFieldsTestCase(APITestCase):
+    """Test sparse fieldsets on task responses"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='sparseuser',
+            password='testpass123',
+            first_name='Sparse'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.task = Task.objects.create(title='Sparse', description='x' * 10000, user=self.user)
+
+    def test_list_fields(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('task-list-create'), {'fields': 'id,title,status'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'id': self.task.id, 'title': 'Sparse', 'status': 'New'}])
+        task_table = f'"{Task._meta.db_table}"'
+        task_queries = [q['sql'] for q in ctx.captured_queries if f'FROM {task_table}' in q['sql']]
+        self.assertTrue(task_queries)
+        for sql in task_queries:
+            self.assertNotIn('"description"', sql)
+
+    def test_detail_fields(self):
+        response = self.client.get(reverse('task-detail', args=[self.task.id]), {'fields': 'user,description'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'user': 'sparseuser', 'description': 'x' * 10000})
+
+    def test_unknown_field(self):
+        response = self.client.get(reverse('task-list-create'), {'fields': 'title,secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data)
+
+    def test_writes_ignore_fields(self):
+        response = self.client.patch(
+            reverse('task-detail', args=[self.task.id]) + '?fields=id',
+            {'title': 'Renamed'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Renamed')
@@ -0,0 +1,104 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+@override_settings(
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'uncached': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    },
+    TASK_LIST_CACHE_ALIAS='uncached',
+)
+class AsyncTaskViewsTestCase(APITestCase):
+    """Test that the async task views answer like the sync ones"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='asyncuser',
+            password='testpass123',
+            first_name='Async'
+        )
+        self.other = User.objects.create_user(
+            username='asyncother',
+            password='testpass123',
+            first_name='Other'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.task = Task.objects.create(title='Async', description='Both stacks', user=self.user)
+        Task.objects.create(title='Started', status='In Progress', user=self.user)
+        self.foreign = Task.objects.create(title='Foreign', user=self.other)
+
+    def both(self, method, name, args=None, **kwargs):
+        """Send the same request to the sync and the async view"""
+        responses = []
+        for urlconf in ('core.urls', 'core.async_urls'):
+            with self.settings(ROOT_URLCONF=urlconf):
+                url = reverse(name, args=args)
+                responses.append(getattr(self.client, method)(url, **kwargs))
+        return responses
+
+    def assertSameResponse(self, method, name, args=None, **kwargs):
+        sync, async_ = self.both(method, name, args, **kwargs)
+        self.assertEqual(async_.status_code, sync.status_code)
+        self.assertEqual(async_.content, sync.content)
+        self.assertEqual(async_.get('Content-Type'), sync.get('Content-Type'))
+        return async_
+
+    def test_list(self):
+        self.assertSameResponse('get', 'task-list-create')
+        self.assertSameResponse('get', 'task-list-create', data={'status': 'New', 'fields': 'id,title'})
+        self.assertSameResponse('get', 'task-list-create', data={'cursor': '', 'ordering': 'title'})
+        self.assertSameResponse('get', 'task-list-create', data={'fields': 'secret'})
+
+    def test_detail(self):
+        self.assertSameResponse('get', 'task-detail', [self.task.id])
+        self.assertSameResponse('get', 'task-detail', [self.foreign.id])
+
+    def test_conditional_get(self):
+        with self.settings(ROOT_URLCONF='core.async_urls'):
+            url = reverse('task-list-create')
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_create_update_complete_delete(self):
+        with self.settings(ROOT_URLCONF='core.async_urls'):
+            response = self.client.post(reverse('task-list-create'), {'title': 'Created'})
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.json(), {'title': 'Created', 'description': None, 'status': 'New'})
+            created = Task.objects.get(title='Created', user=self.user)
+
+            url = reverse('task-detail', args=[created.id])
+            response = self.client.patch(url, {'status': 'In Progress'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()['status'], 'In Progress')
+
+            response = self.client.post(reverse('task-complete', args=[created.id]))
+            self.assertEqual(response.json()['task']['status'], 'Completed')
+
+            response = self.client.delete(url)
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+            self.assertFalse(Task.objects.filter(id=created.id).exists())
+
+    def test_invalid_write(self):
+        self.assertSameResponse('post', 'task-list-create', data={'title': 'Bad', 'status': 'Unknown'})
+
+    def test_precondition_failed(self):
+        with self.settings(ROOT_URLCONF='core.async_urls'):
+            url = reverse('task-detail', args=[self.task.id])
+            response = self.client.patch(url, {'title': 'Late'}, HTTP_IF_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_authentication_required(self):
+        self.client.credentials()
+        self.assertSameResponse('get', 'task-list-create')
+        self.assertSameResponse('post', 'task-complete', [self.task.id])
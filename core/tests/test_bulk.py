@@ -0,0 +1,97 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+class BulkTaskAPITestCase(APITestCase):
+    """Test the bulk task endpoint"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='bulkuser',
+            password='testpass123',
+            first_name='Bulk'
+        )
+        self.other = User.objects.create_user(
+            username='otheruser',
+            password='testpass123',
+            first_name='Other'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-bulk')
+        self.own = Task.objects.create(title='Own', status='New', user=self.user)
+        self.foreign = Task.objects.create(title='Foreign', status='New', user=self.other)
+
+    def post(self, data):
+        return self.client.post(self.url, data, format='json')
+
+    def test_bulk_create(self):
+        response = self.post({'create': [
+            {'title': 'First'},
+            {'title': 'Second', 'status': 'In Progress'},
+            {'title': 'Bad', 'status': 'Unknown'},
+        ]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['create']
+        self.assertEqual([r['status'] for r in results], [201, 201, 400])
+        self.assertEqual(results[1]['task']['status'], 'In Progress')
+        self.assertEqual(results[0]['task']['user'], 'bulkuser')
+        self.assertIn('status', results[2]['errors'])
+        self.assertEqual(Task.objects.filter(user=self.user).count(), 3)
+
+    def test_bulk_update_enforces_ownership(self):
+        response = self.post({'update': [
+            {'id': self.own.id, 'title': 'Renamed'},
+            {'id': self.foreign.id, 'title': 'Hijacked'},
+        ]})
+        self.assertEqual([r['status'] for r in response.data['update']], [200, 404])
+        self.own.refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.own.title, 'Renamed')
+        self.assertEqual(self.own.status, 'New')
+        self.assertEqual(self.foreign.title, 'Foreign')
+
+    def test_bulk_complete_and_delete(self):
+        extra = Task.objects.create(title='Extra', user=self.user)
+        response = self.post({
+            'complete': [self.own.id, self.foreign.id],
+            'delete': [extra.id, self.foreign.id],
+        })
+        self.assertEqual([r['status'] for r in response.data['complete']], [200, 404])
+        self.assertEqual([r['status'] for r in response.data['delete']], [204, 404])
+        self.own.refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.own.status, 'Completed')
+        self.assertEqual(self.foreign.status, 'New')
+        self.assertFalse(Task.objects.filter(id=extra.id).exists())
+        self.assertTrue(Task.objects.filter(id=self.foreign.id).exists())
+
+    def test_empty_request_rejected(self):
+        response = self.post({})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_independent_of_batch_size(self):
+        def sync(size):
+            tasks = Task.objects.bulk_create(Task(title=f'T{i}', user=self.user) for i in range(size * 3))
+            ids = [task.id for task in tasks]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.post({
+                    'create': [{'title': f'N{i}'} for i in range(size)],
+                    'update': [{'id': pk, 'status': 'In Progress'} for pk in ids[:size]],
+                    'complete': ids[size:size * 2],
+                    'delete': ids[size * 2:],
+                })
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(ctx.captured_queries)
+
+        sync(1)
+        self.assertEqual(sync(2), sync(50))
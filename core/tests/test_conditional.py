@@ -0,0 +1,240 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+class ConditionalRequestTestCase(APITestCase):
+    """Test ETag / Last-Modified handling on task endpoints"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='etaguser',
+            password='testpass123',
+            first_name='Etag'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.list_url = reverse('task-list-create')
+        self.task = Task.objects.create(title='Poll me', user=self.user)
+        self.detail_url = reverse('task-detail', args=[self.task.id])
+
+    def assertNotModified(self, url, etag):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        return ctx.captured_queries
+
+    def assertModified(self, url, etag):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_not_modified(self):
+        etag = self.client.get(self.list_url)['ETag']
+        queries = self.assertNotModified(self.list_url, etag)
+        task_table = Task._meta.db_table
+        self.assertFalse([q for q in queries if f'"{task_table}"' in q['sql']])
+
+    def test_list_etag_depends_on_query(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.assertModified(f'{self.list_url}?status=New', etag)
+
+    def test_list_if_modified_since(self):
+        last_modified = self.client.get(self.list_url)['Last-Modified']
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_changes_after_writes(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.client.post(self.list_url, {'title': 'Another'})
+        self.assertModified(self.list_url, etag)
+
+        etag = self.client.get(self.list_url)['ETag']
+        self.client.post(reverse('task-complete', args=[self.task.id]))
+        self.assertModified(self.list_url, etag)
+
+        etag = self.client.get(self.list_url)['ETag']
+        self.client.post(reverse('task-bulk'), {'delete': [self.task.id]}, format='json')
+        self.assertModified(self.list_url, etag)
+
+    def test_detail_not_modified(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.assertNotModified(self.detail_url, etag)
+        self.client.patch(self.detail_url, {'title': 'Changed'})
+        self.assertModified(self.detail_url, etag)
+
+    def test_if_match_rejects_stale_write(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.client.patch(self.detail_url, {'title': 'Changed elsewhere'})
+        response = self.client.patch(self.detail_url, {'title': 'Mine'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, 'Changed elsewhere')
+
+    def test_if_match_allows_current_write(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        response = self.client.patch(self.detail_url, {'title': 'Mine'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = self.client.get(self.detail_url)['ETag']
+        response = self.client.delete(self.detail_url, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_if_match_on_missing_task(self):
+        url = reverse('task-detail', args=[self.task.id + 1000])
+        response = self.client.delete(url, HTTP_IF_MATCH='"abc"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskChangesTestCase(APITestCase):
+    """Test the delta sync endpoint"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='syncuser',
+            password='testpass123',
+            first_name='Sync'
+        )
+        other = User.objects.create_user(
+            username='syncother',
+            password='testpass123',
+            first_name='Other'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-changes')
+        self.tasks = [Task.objects.create(title=f'Task {i}', user=self.user) for i in range(5)]
+        Task.objects.create(title='Not mine', user=other)
+
+    def sync(self, cursor=None, limit=None):
+        params = {}
+        if cursor:
+            params['since'] = cursor
+        if limit:
+            params['limit'] = limit
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_initial_sync_returns_everything_in_pages(self):
+        first = self.sync(limit=3)
+        self.assertTrue(first['has_more'])
+        second = self.sync(first['cursor'], limit=3)
+        self.assertFalse(second['has_more'])
+        ids = [task['id'] for task in first['changed'] + second['changed']]
+        self.assertEqual(ids, [task.id for task in self.tasks])
+
+    def test_incremental_sync(self):
+        cursor = self.sync()['cursor']
+        self.assertEqual(self.sync(cursor)['changed'], [])
+
+        self.client.patch(reverse('task-detail', args=[self.tasks[1].id]), {'title': 'Edited'})
+        self.client.delete(reverse('task-detail', args=[self.tasks[2].id]))
+        self.client.post(reverse('task-bulk'), {'delete': [self.tasks[3].id]}, format='json')
+        self.client.post(reverse('task-complete', args=[self.tasks[4].id]))
+
+        changes = self.sync(cursor)
+        self.assertEqual(
+            [task['id'] for task in changes['changed']],
+            [self.tasks[1].id, self.tasks[4].id]
+        )
+        self.assertEqual(changes['deleted'], [self.tasks[2].id, self.tasks[3].id])
+        self.assertEqual(self.sync(changes['cursor'])['changed'], [])
+
+    def test_changes_follow_commit_order(self):
+        cursor = self.sync()['cursor']
+        # Stamped before that sync, as by a transaction that committed after it
+        Task.objects.filter(pk=self.tasks[0].pk).update(title='Late', updated_at=self.tasks[0].created_at)
+        changes = self.sync(cursor)
+        self.assertEqual([task['id'] for task in changes['changed']], [self.tasks[0].id])
+
+    def test_initial_sync_skips_earlier_deletions(self):
+        self.tasks[0].delete()
+        changes = self.sync()
+        self.assertEqual(changes['deleted'], [])
+        deleted = self.tasks[1].id
+        self.tasks[1].delete()
+        self.assertEqual(self.sync(changes['cursor'])['deleted'], [deleted])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'since': 'nope'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskListCacheTestCase(APITestCase):
+    """Test the versioned task list response cache"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='cacheuser',
+            password='testpass123',
+            first_name='Cache'
+        )
+        self.other = User.objects.create_user(
+            username='cacheother',
+            password='testpass123',
+            first_name='Other'
+        )
+        self.admin = User.objects.create_user(
+            username='cacheadmin',
+            password='testpass123',
+            first_name='Admin',
+            is_staff=True
+        )
+        self.authenticate(self.user)
+        self.list_url = reverse('task-list-create')
+        self.all_url = reverse('task-list-all')
+        Task.objects.create(title='Cached', user=self.user)
+
+    def authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.assertEqual(self.get(self.list_url)['X-Cache'], 'MISS')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.get(self.list_url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        task_table = Task._meta.db_table
+        self.assertFalse([q for q in ctx.captured_queries if f'"{task_table}"' in q['sql']])
+
+    def test_write_invalidates_user_lists(self):
+        self.get(self.list_url)
+        self.client.post(self.list_url, {'title': 'Fresh'})
+        response = self.get(self.list_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 2)
+
+    def test_other_users_writes_keep_cache(self):
+        self.get(self.list_url)
+        Task.objects.create(title='Elsewhere', user=self.other)
+        self.assertEqual(self.get(self.list_url)['X-Cache'], 'HIT')
+
+    def test_all_tasks_list_invalidated_by_any_write(self):
+        self.get(self.all_url)
+        self.assertEqual(self.get(self.all_url)['X-Cache'], 'HIT')
+        Task.objects.create(title='Elsewhere', user=self.other)
+        response = self.get(self.all_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 2)
+
+    def test_stats_are_admin_only(self):
+        self.assertEqual(self.client.get(reverse('task-cache-stats')).status_code, status.HTTP_403_FORBIDDEN)
+        self.authenticate(self.admin)
+        response = self.get(reverse('task-cache-stats'))
+        self.assertIn('hits', response.data)
+        self.assertIn('misses', response.data)
@@ -0,0 +1,170 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+from core.serializers import TaskSerializer
+
+User = get_user_model()
+
+
+class TaskExportTestCase(APITestCase):
+    """Test streaming task export"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='exportuser',
+            password='testpass123',
+            first_name='Export'
+        )
+        self.staff = User.objects.create_user(
+            username='staffuser',
+            password='testpass123',
+            first_name='Staff',
+            is_staff=True
+        )
+        self.url = reverse('task-export')
+        for i in range(5):
+            Task.objects.create(
+                title=f'Task {i}',
+                description='Line one\nline "two", three',
+                status='New' if i % 2 else 'Completed',
+                user=self.user
+            )
+        Task.objects.create(title='Staff task', user=self.staff)
+
+    def authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def stream(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_ndjson_matches_serializer(self):
+        self.authenticate(self.user)
+        response, body = self.stream()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        expected = TaskSerializer(Task.objects.filter(user=self.user).order_by('-created_at'), many=True).data
+        self.assertEqual(rows, json.loads(json.dumps(expected)))
+
+    def test_csv_with_filter_and_ordering(self):
+        self.authenticate(self.user)
+        response, body = self.stream(format='csv', status='New', ordering='title')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual([row['title'] for row in rows], ['Task 1', 'Task 3'])
+        self.assertEqual(rows[0]['description'], 'Line one\nline "two", three')
+
+    def test_staff_exports_every_task(self):
+        self.authenticate(self.staff)
+        _, body = self.stream()
+        self.assertEqual(len(body.splitlines()), 6)
+
+    def test_authentication_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TaskImportTestCase(APITestCase):
+    """Test bulk task import"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='importuser',
+            password='testpass123',
+            first_name='Import'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-import')
+
+    def upload(self, name, content, **data):
+        upload = SimpleUploadedFile(name, content.encode('utf-8'))
+        return self.client.post(self.url, {'file': upload, **data}, format='multipart')
+
+    def test_import_csv(self):
+        content = (
+            'title,description,status\n'
+            'First,"multi\nline, ""quoted""",New\n'
+            'Second,,In Progress\n'
+            ',missing title,New\n'
+            'Third,,Bogus\n'
+        )
+        response = self.upload('tasks.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['imported'], 2)
+        self.assertEqual(response.data['failed'], 2)
+        self.assertEqual([error['line'] for error in response.data['errors']], [5, 6])
+        self.assertIn('status', response.data['errors'][1]['errors'])
+
+        first = Task.objects.get(user=self.user, title='First')
+        self.assertEqual(first.description, 'multi\nline, "quoted"')
+        self.assertIsNone(Task.objects.get(user=self.user, title='Second').description)
+
+    def test_import_ndjson(self):
+        content = (
+            '{"title": "One"}\n'
+            '\n'
+            'not json\n'
+            '{"title": "Two", "status": "Completed", "description": "d"}\n'
+        )
+        response = self.upload('tasks.ndjson', content)
+        self.assertEqual(response.data['imported'], 2)
+        self.assertEqual(response.data['errors'][0]['line'], 3)
+        self.assertEqual(
+            sorted(Task.objects.filter(user=self.user).values_list('title', 'status')),
+            [('One', 'New'), ('Two', 'Completed')]
+        )
+
+    def test_import_rejects_characters_the_api_rejects(self):
+        content = (
+            '{"title": "Nul\\u0000"}\n'
+            '{"title": "Ok", "description": "Nul\\u0000"}\n'
+            '{"title": "Surrogate\\ud800"}\n'
+            '{"title": 7, "description": 8}\n'
+            '{"title": "List", "description": ["a"]}\n'
+        )
+        response = self.upload('tasks.ndjson', content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([error['line'] for error in response.data['errors']], [1, 2, 3, 5])
+        self.assertIn('description', response.data['errors'][1]['errors'])
+        self.assertEqual(
+            list(Task.objects.filter(user=self.user).values_list('title', 'description')),
+            [('7', '8')]
+        )
+
+    def test_import_rejects_malformed_csv(self):
+        content = 'title,description\nFirst,\nSecond,' + 'x' * (csv.field_size_limit() + 1) + '\n'
+        response = self.upload('tasks.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Line 3', response.data['file'][0])
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+
+    def test_import_rejects_unknown_format(self):
+        response = self.upload('tasks.txt', 'title\nA\n', format='xml')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            handle.write('title,status\n' + ''.join(f'Task {i},New\n' for i in range(50)))
+        out = io.StringIO()
+        try:
+            call_command('import_tasks', handle.name, user='importuser', batch_size=7, stdout=out)
+        finally:
+            os.unlink(handle.name)
+        self.assertIn('Imported 50 tasks', out.getvalue())
+        self.assertEqual(Task.objects.filter(user=self.user).count(), 50)
@@ -0,0 +1,80 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import hashing
+
+User = get_user_model()
+
+
+@override_settings(PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE=0, PASSWORD_HASHING_RETRY_AFTER=3)
+class PasswordHashingPoolTestCase(APITestCase):
+    """Test that password hashing runs on the bounded pool"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='hashuser', password='testpass123', first_name='Hash')
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def saturate(self):
+        """Occupy the only hashing thread until the test ends"""
+        hashing.get_pool().submit(self.release.wait)
+
+    def test_hashes_on_pool_thread(self):
+        submitted = []
+        pool = hashing.get_pool()
+        original = pool.executor.submit
+
+        def submit(fn, *args, **kwargs):
+            submitted.append(fn)
+            return original(fn, *args, **kwargs)
+
+        pool.executor.submit = submit
+        encoded = make_password('secret-password')
+        self.assertTrue(encoded.startswith('pbkdf2_sha256$'))
+        self.assertTrue(check_password('secret-password', encoded))
+        self.assertEqual(len(submitted), 2)
+
+    def test_saturated_registration_is_rejected(self):
+        self.saturate()
+        response = self.client.post(reverse('register'), {
+            'first_name': 'Busy',
+            'username': 'busyuser',
+            'password': 'securepass123',
+            'password_confirm': 'securepass123',
+        })
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '3')
+        self.assertFalse(User.objects.filter(username='busyuser').exists())
+
+    def test_saturated_login_is_rejected(self):
+        self.saturate()
+        response = self.client.post(reverse('token_obtain_pair'), {
+            'username': 'hashuser',
+            'password': 'testpass123',
+        })
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        self.release.set()
+        hashing.get_pool().executor.submit(lambda: None).result()
+        response = self.client.post(reverse('token_obtain_pair'), {
+            'username': 'hashuser',
+            'password': 'testpass123',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_saturated_admin_login_is_rejected(self):
+        self.saturate()
+        response = self.client.post(reverse('admin:login'), {'username': 'hashuser', 'password': 'testpass123'})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_task_reads_do_not_hash(self):
+        self.saturate()
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse('task-list-create'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
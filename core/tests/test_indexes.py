@@ -0,0 +1,104 @@
+import re
+import unittest
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from core import partitions, sync
+from core.models import Task
+
+User = get_user_model()
+
+SORT_NODE = re.compile(r'(?:^|-> +)(?:Incremental )?Sort +\(', re.MULTILINE)
+# Lands in the default partition
+OUTSIDE_PARTITIONS = datetime(2001, 1, 1, tzinfo=dt_timezone.utc)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN checks need PostgreSQL')
+class TaskIndexUsageTestCase(TestCase):
+    """
+    Check that the planner serves the hot task queries from the composite
+    indexes without a sequential scan or a separate sort step
+    """
+    USERS = 20
+    TASKS_PER_USER = 500
+
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create(
+            User(username=f'indexuser{i}', first_name='Index') for i in range(cls.USERS)
+        )
+        users = list(User.objects.filter(username__startswith='indexuser'))
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        Task.objects.bulk_create(
+            (
+                Task(title=f'Task {i}', status=statuses[i % len(statuses)], user=user)
+                for user in users
+                for i in range(cls.TASKS_PER_USER)
+            ),
+            batch_size=2000,
+        )
+        # Spread the tasks over every partition, the default one included,
+        # so each partition's plan is checked against its own statistics
+        cls.partitions = partitions.list_partitions(connection)
+        with connection.cursor() as cursor:
+            for number, name in enumerate(cls.partitions):
+                month = partitions.partition_month(name) or OUTSIDE_PARTITIONS
+                cursor.execute(
+                    f"""UPDATE {Task._meta.db_table} SET "created_at" = %s + mod("id", 1000000) * interval '1 second'
+                    WHERE mod("id", %s) = %s""",
+                    [month, len(cls.partitions), number]
+                )
+            for name in cls.partitions:
+                cursor.execute(f'ANALYZE {name}')
+            cursor.execute(f'ANALYZE {Task._meta.db_table}')
+        cls.user = users[0]
+
+    def assertUsesIndex(self, queryset, index_name):
+        """Every partition is read through its copy of the index"""
+        plan = queryset.explain()
+        for name in self.partitions:
+            self.assertIn(f"{index_name}_{name.removeprefix(f'{Task._meta.db_table}_')}", plan)
+        self.assertNotIn('Seq Scan', plan)
+        # Merge Append lists a "Sort Key"; only Sort nodes are extra work
+        self.assertIsNone(SORT_NODE.search(plan), plan)
+
+    def test_user_tasks_by_created_at(self):
+        queryset = Task.objects.filter(user=self.user)
+        self.assertUsesIndex(queryset.order_by('-created_at')[:10], 'task_user_created_idx')
+        self.assertUsesIndex(queryset.order_by('-created_at', '-id')[:10], 'task_user_created_idx')
+
+    def test_user_tasks_by_title(self):
+        queryset = Task.objects.filter(user=self.user).order_by('title', 'id')[:10]
+        self.assertUsesIndex(queryset, 'task_user_title_idx')
+
+    def test_user_tasks_by_status_and_created_at(self):
+        queryset = Task.objects.filter(user=self.user, status='Completed').order_by('-created_at', '-id')[:10]
+        self.assertUsesIndex(queryset, 'task_user_status_created_idx')
+
+    def test_user_tasks_by_status_and_title(self):
+        queryset = Task.objects.filter(user=self.user, status='Completed').order_by('title', 'id')[:10]
+        self.assertUsesIndex(queryset, 'task_user_status_title_idx')
+
+    def test_open_user_tasks(self):
+        queryset = (
+            Task.objects.filter(user=self.user)
+            .exclude(status='Completed')
+            .order_by('-created_at', '-id')[:10]
+        )
+        self.assertUsesIndex(queryset, 'task_user_open_idx')
+
+    def test_all_tasks_by_created_at(self):
+        queryset = Task.objects.order_by('-created_at', '-id')[:10]
+        self.assertUsesIndex(queryset, 'task_created_idx')
+
+    def test_changes_since_cursor(self):
+        since = Task.objects.filter(user=self.user).order_by('version', 'id')[250]
+        queryset = (
+            Task.objects.filter(user=self.user)
+            .filter(sync.after('version', since.version, since.id))
+            .order_by('version', 'id')[:100]
+        )
+        self.assertUsesIndex(queryset, 'task_user_version_idx')
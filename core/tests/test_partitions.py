@@ -0,0 +1,99 @@
+import unittest
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from core import partitions
+from core.models import ArchivedTask, Task, TaskCounter, TaskTombstone, TaskVersion
+
+User = get_user_model()
+
+
+class TaskArchiveTestCase(TestCase):
+    """Test moving long-completed tasks to the archived task table"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='archiveuser', password='testpass123', first_name='Archive')
+        self.old = Task.objects.create(title='Old', status='Completed', user=self.user)
+        self.recent = Task.objects.create(title='Recent', status='Completed', user=self.user)
+        self.open = Task.objects.create(title='Open', user=self.user)
+        Task.objects.filter(pk__in=[self.old.pk, self.open.pk]).update(
+            updated_at=timezone.now() - timedelta(days=365)
+        )
+        self.cutoff = timezone.now() - timedelta(days=180)
+
+    def test_archive_moves_completed_tasks(self):
+        token, _ = TaskVersion.objects.for_user(self.user)
+        archived = Task.objects.filter(status='Completed', updated_at__lt=self.cutoff).archive(batch_size=1)
+        self.assertEqual(archived, 1)
+
+        self.assertEqual(set(Task.objects.values_list('title', flat=True)), {'Recent', 'Open'})
+        copy = ArchivedTask.objects.get(pk=self.old.pk)
+        self.assertEqual(copy.title, 'Old')
+        self.assertEqual(copy.created_at, self.old.created_at)
+        # Archived tasks leave delta sync and the counters like deleted ones
+        self.assertTrue(TaskTombstone.objects.filter(task_id=self.old.pk).exists())
+        self.assertNotEqual(TaskVersion.objects.for_user(self.user)[0], token)
+        self.assertEqual(TaskCounter.objects.for_user(self.user)['Completed'], 1)
+
+    def test_archive_nothing(self):
+        cutoff = self.cutoff - timedelta(days=365)
+        self.assertEqual(Task.objects.filter(status='Completed', updated_at__lt=cutoff).archive(), 0)
+        self.assertEqual(ArchivedTask.objects.count(), 0)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'Partitioning needs PostgreSQL')
+class TaskPartitionTestCase(TestCase):
+    """Test the monthly partitions of the task table"""
+    MONTH = datetime(2001, 1, 1, tzinfo=dt_timezone.utc)
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='partitionuser', password='testpass123', first_name='Partition')
+        self.task = Task.objects.create(title='Old', status='Completed', user=self.user)
+        Task.objects.filter(pk=self.task.pk).update(created_at=self.MONTH + timedelta(days=14))
+
+    def count_rows(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM {table}')
+            return cursor.fetchone()[0]
+
+    def test_table_is_partitioned(self):
+        self.assertTrue(partitions.is_partitioned(connection))
+        names = partitions.list_partitions(connection)
+        self.assertIn(partitions.partition_name(partitions.month_start(timezone.now())), names)
+        self.assertEqual(names[-1], partitions.DEFAULT_PARTITION)
+
+    def test_create_partition_moves_rows_from_default(self):
+        self.assertEqual(self.count_rows(partitions.DEFAULT_PARTITION), 1)
+        self.assertTrue(partitions.create_partition(connection, self.MONTH))
+        self.assertFalse(partitions.create_partition(connection, self.MONTH))
+
+        self.assertEqual(self.count_rows(partitions.DEFAULT_PARTITION), 0)
+        self.assertEqual(self.count_rows('core_task_p2001_01'), 1)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).title, 'Old')
+        self.assertEqual(TaskCounter.objects.for_user(self.user)['Completed'], 1)
+
+    def test_detach_partition(self):
+        partitions.create_partition(connection, self.MONTH)
+        token, _ = TaskVersion.objects.for_user(self.user)
+
+        self.assertEqual(partitions.detach_partition(connection, 'core_task_p2001_01'), 1)
+        self.assertNotIn('core_task_p2001_01', partitions.list_partitions(connection))
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertEqual(self.count_rows('core_task_p2001_01'), 1)
+        self.assertEqual(
+            TaskTombstone.objects.get(task_id=self.task.pk).version,
+            TaskVersion.objects.get(user=self.user).version
+        )
+        self.assertNotEqual(TaskVersion.objects.for_user(self.user)[0], token)
+        self.assertEqual(TaskCounter.objects.for_user(self.user)['Completed'], 0)
+
+    def test_partition_with_open_tasks_stays_attached(self):
+        Task.objects.filter(pk=self.task.pk).update(status='New')
+        partitions.create_partition(connection, self.MONTH)
+
+        self.assertIsNone(partitions.detach_partition(connection, 'core_task_p2001_01', drop=True))
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
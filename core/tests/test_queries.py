@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+class QueryCountMixin:
+    """
+    Assertions that guard list endpoints against N+1 queries
+    """
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def assertQueryCountIndependentOfPageSize(self, url, create_tasks):
+        """
+        Render a page holding one task, fill the page up and render it again.
+        Both renders must issue the same number of queries. A warm-up request
+        fills per-process caches first so they do not skew the first count.
+        """
+        create_tasks(1)
+        self.count_queries(url)
+        small_page = self.count_queries(url)
+        create_tasks(settings.REST_FRAMEWORK['PAGE_SIZE'] - 1)
+        full_page = self.count_queries(url)
+        self.assertEqual(
+            small_page, full_page,
+            f"{url} issued {small_page} queries for 1 row and {full_page} for a full page"
+        )
+
+
+@override_settings(
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'uncached': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    },
+    TASK_LIST_CACHE_ALIAS='uncached',
+)
+class TaskListQueryCountTestCase(QueryCountMixin, APITestCase):
+    """Test that task endpoints do not issue a query per task"""
+
+    def setUp(self):
+        self.owners = [
+            User.objects.create_user(
+                username=f'owner{i}',
+                password='testpass123',
+                first_name='Owner'
+            )
+            for i in range(3)
+        ]
+        self.user = self.owners[0]
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def create_own_tasks(self, count):
+        Task.objects.bulk_create(
+            Task(title=f'Task {i}', user=self.user) for i in range(count)
+        )
+
+    def create_mixed_tasks(self, count):
+        Task.objects.bulk_create(
+            Task(title=f'Task {i}', user=self.owners[i % len(self.owners)])
+            for i in range(count)
+        )
+
+    def test_task_list_all_query_count(self):
+        self.assertQueryCountIndependentOfPageSize(reverse('task-list-all'), self.create_mixed_tasks)
+
+    def test_task_list_create_query_count(self):
+        self.assertQueryCountIndependentOfPageSize(reverse('task-list-create'), self.create_own_tasks)
+
+    def test_user_tasks_query_count(self):
+        self.assertQueryCountIndependentOfPageSize(reverse('user-tasks'), self.create_own_tasks)
+
+    def test_task_detail_loads_owner_with_task(self):
+        task = Task.objects.create(title='Detail', user=self.user)
+        url = reverse('task-detail', args=[task.id])
+        # One query for the JWT user, one for the task and its owner
+        self.assertEqual(self.count_queries(url), 2)
+
+    def test_deep_cursor_page_skips_count_and_offset(self):
+        self.create_own_tasks(30)
+        url = f"{reverse('task-list-create')}?cursor="
+        for _ in range(2):
+            url = self.client.get(url).data['next']
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = ' '.join(query['sql'] for query in ctx.captured_queries).upper()
+        self.assertNotIn('COUNT(', sql)
+        self.assertNotIn('OFFSET', sql)
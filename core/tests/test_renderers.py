@@ -0,0 +1,72 @@
+import datetime
+import decimal
+import io
+import unittest
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core import parsers, renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+class FastJSONTestCase(SimpleTestCase):
+    """Test that the fast renderer and parser match DRF's JSON ones"""
+
+    data = {
+        'id': 1,
+        'title': 'Ünïcode "quoted" \u2028 line separator',
+        'description': None,
+        'done': False,
+        'score': 1.5,
+        'price': decimal.Decimal('9.99'),
+        'uid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'created_at': datetime.datetime(2026, 10, 17, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+        'updated_at': datetime.datetime(2026, 10, 17, 12, 30, tzinfo=datetime.timezone.utc),
+        'local': datetime.datetime(2026, 10, 17, 14, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        'due': datetime.date(2026, 10, 18),
+        'results': [{'nested': ['a', 2, None]}],
+        'lazy': gettext_lazy('Task'),
+    }
+
+    def assertRendersLikeJSONRenderer(self, data, accepted_media_type=None):
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type)
+        )
+
+    @unittest.skipIf(renderers.orjson is None, "orjson is not installed")
+    def test_orjson_output_matches(self):
+        self.assertRendersLikeJSONRenderer(self.data)
+        self.assertRendersLikeJSONRenderer([self.data, {}])
+        self.assertRendersLikeJSONRenderer({1: 'non-string key'})
+
+    def test_stdlib_fallback_matches(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertRendersLikeJSONRenderer(self.data)
+
+    def test_indented_output_matches(self):
+        self.assertRendersLikeJSONRenderer(self.data, 'application/json; indent=4')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), 'application/json', {'encoding': 'utf-8'})
+
+    def test_parser_matches(self):
+        body = JSONRenderer().render(self.data)
+        self.assertEqual(self.parse(FastJSONParser(), body), self.parse(JSONParser(), body))
+        with mock.patch.object(parsers, 'orjson', None):
+            self.assertEqual(self.parse(FastJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_parser_rejects_invalid_json(self):
+        for body in (b'{"title": ', b'{"score": NaN}'):
+            with self.assertRaises(ParseError):
+                self.parse(FastJSONParser(), body)
@@ -0,0 +1,124 @@
+import unittest
+
+from django.contrib.auth import get_user_model
+from django.db import connection, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core import routers
+from core.middleware import ReplicaRoutingMiddleware
+from core.models import Task, TaskVersion
+from core.views import TaskListAllView
+
+User = get_user_model()
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    DATABASE_REPLICAS=['replica1', 'replica2'],
+    REPLICA_PIN_SECONDS=10,
+)
+class ReplicaRoutingTestCase(SimpleTestCase):
+    """Test where PrimaryReplicaRouter sends reads and writes"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User(pk=1, username='routed')
+        routers.get_pin_cache().clear()
+
+    def call(self, request, write=False, user=None):
+        """
+        Run a view through the middleware that records the databases its
+        reads would use, before and after an optional write
+        """
+        seen = []
+
+        def view(request):
+            if user is not None:
+                request.user = user
+            seen.append(router.db_for_read(Task))
+            if write:
+                self.assertEqual(router.db_for_write(Task), 'default')
+                seen.append(router.db_for_read(Task))
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(request)
+        return seen, response
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(router.db_for_read(Task), 'default')
+
+    def test_safe_request_reads_from_one_replica(self):
+        def view(request):
+            databases = {router.db_for_read(Task) for _ in range(20)}
+            self.assertEqual(len(databases), 1)
+            self.assertIn(databases.pop(), ['replica1', 'replica2'])
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(self.factory.get('/api/tasks/'))
+        self.assertNotIn('db_pin', response.cookies)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_reads_use_primary(self):
+        seen, _ = self.call(self.factory.get('/api/tasks/'))
+        self.assertEqual(seen, ['default'])
+
+    def test_unsafe_request_reads_from_primary(self):
+        seen, _ = self.call(self.factory.post('/api/tasks/'))
+        self.assertEqual(seen, ['default'])
+
+    def test_write_pins_rest_of_request_and_client(self):
+        seen, response = self.call(self.factory.get('/api/tasks/'), write=True)
+        self.assertIn(seen[0], ['replica1', 'replica2'])
+        self.assertEqual(seen[1], 'default')
+        self.assertEqual(response.cookies['db_pin']['max-age'], 10)
+
+        request = self.factory.get('/api/tasks/')
+        request.COOKIES['db_pin'] = '1'
+        seen, _ = self.call(request)
+        self.assertEqual(seen, ['default'])
+
+    def test_write_pins_user(self):
+        self.call(self.factory.post('/api/tasks/'), write=True, user=self.user)
+
+        seen, _ = self.call(self.factory.get('/api/tasks/'), user=self.user)
+        self.assertEqual(seen, ['default'])
+
+        other = User(pk=2, username='other')
+        seen, _ = self.call(self.factory.get('/api/tasks/'), user=other)
+        self.assertIn(seen[0], ['replica1', 'replica2'])
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(router.allow_migrate('replica1', 'core'))
+        self.assertTrue(router.allow_migrate('default', 'core'))
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'The global version is a PostgreSQL sequence')
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    DATABASE_REPLICAS=['replica1'],
+)
+class GlobalVersionRoutingTestCase(TestCase):
+    """Test that the global task version is never read on a replica"""
+
+    def test_global_version_reads_primary(self):
+        seen = {}
+
+        def view(request):
+            seen['tasks'] = router.db_for_read(Task)
+            # replica1 is not configured, so reading it would raise
+            with CaptureQueriesContext(connection) as ctx:
+                seen['version'] = TaskVersion.objects.global_version()
+            seen['queries'] = len(ctx.captured_queries)
+            seen['all'] = TaskListAllView(request=request).get_queryset().db
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(RequestFactory().get('/api/tasks/all/'))
+        self.assertEqual(seen['tasks'], 'replica1')
+        self.assertTrue(seen['version'].startswith('g'))
+        self.assertEqual(seen['queries'], 1)
+        # The tasks it versions come from the same copy
+        self.assertEqual(seen['all'], 'default')
+        # Reading the primary does not pin the client
+        self.assertNotIn('db_pin', response.cookies)
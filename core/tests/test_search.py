@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+class TaskSearchTestCase(APITestCase):
+    """Test full-text search on the task list views"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='searchuser',
+            password='testpass123',
+            first_name='Search'
+        )
+        self.other = User.objects.create_user(
+            username='searchother',
+            password='testpass123',
+            first_name='Other'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-list-create')
+        self.in_description = Task.objects.create(
+            title='Weekly chores', description='Pay the invoices', user=self.user
+        )
+        self.in_title = Task.objects.create(
+            title='Invoice review', description='Check totals', user=self.user
+        )
+        Task.objects.create(title='Walk the dog', user=self.user)
+        Task.objects.create(title='Invoice of someone else', user=self.other)
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['id'] for task in response.data['results']]
+
+    def test_search_is_stemmed_and_ranked(self):
+        # Title matches weigh more than description matches
+        self.assertEqual(self.search(search='invoicing'), [self.in_title.id, self.in_description.id])
+
+    def test_search_with_ordering(self):
+        self.assertEqual(
+            self.search(search='invoice', ordering='created_at'),
+            [self.in_description.id, self.in_title.id]
+        )
+
+    def test_search_web_syntax(self):
+        self.assertEqual(self.search(search='invoice -review'), [self.in_description.id])
+
+    def test_search_with_cursor_pagination(self):
+        self.assertEqual(
+            self.search(search='invoice', cursor=''),
+            [self.in_title.id, self.in_description.id]
+        )
@@ -0,0 +1,49 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Task
+from core.serializers import TaskSerializer, TaskValuesSerializer
+
+User = get_user_model()
+
+
+class TaskValuesSerializerTestCase(TestCase):
+    """Test that the fast list path renders exactly like TaskSerializer"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='fastuser',
+            password='testpass123',
+            first_name='Fast'
+        )
+        Task.objects.create(title='With description', description='Ünïcode "quoted"', user=self.user)
+        Task.objects.create(title='Without description', status='In Progress', user=self.user)
+        Task.objects.create(title='', description='', status='Completed', user=self.user)
+        self.queryset = Task.objects.filter(user=self.user).select_related('user').order_by('-created_at', '-id')
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_output_is_identical(self):
+        fast = TaskValuesSerializer()
+        self.assertEqual(
+            self.render(fast.to_representation(fast.values(self.queryset))),
+            self.render(TaskSerializer(self.queryset, many=True).data)
+        )
+
+    def test_sparse_output_is_identical(self):
+        fields = {'title', 'user', 'updated_at'}
+        fast = TaskValuesSerializer(fields=fields)
+        self.assertEqual(
+            self.render(fast.to_representation(fast.values(self.queryset))),
+            self.render(TaskSerializer(self.queryset, many=True, context={'fields': fields}).data)
+        )
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('bench_task_serializer', sizes=[10], repeat=1, stdout=out)
+        self.assertIn('x', out.getvalue().splitlines()[-1])
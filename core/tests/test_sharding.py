@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.db.models import Count, Max
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from core import sharding
+from core.models import Task, TaskVersion
+from core.serializers import TaskValuesSerializer
+
+User = get_user_model()
+
+
+@override_settings(TASK_SHARDS=['shard1', 'shard2', 'shard3'])
+class ShardRoutingTestCase(SimpleTestCase):
+    """Test that task rows are routed to the shard of their user"""
+
+    def test_shard_is_stable_hash_of_user(self):
+        self.assertEqual(sharding.shard_for_user(1), 'shard3')
+        self.assertEqual(sharding.shard_for_user(7), 'shard1')
+        self.assertEqual(
+            {sharding.shard_for_user(user_id) for user_id in range(1, 100)},
+            {'shard1', 'shard2', 'shard3'}
+        )
+
+    def test_user_scoped_queries_use_shard(self):
+        user = User(pk=1, username='sharded')
+        self.assertEqual(Task.objects.owned_by(user).db, 'shard3')
+        self.assertEqual(TaskVersion.objects.owned_by(user).db, 'shard3')
+        self.assertEqual(router.db_for_write(Task, instance=Task(user_id=7)), 'shard1')
+        # Assigning an owner routes the new task by the user
+        self.assertEqual(router.db_for_write(Task, instance=user), 'shard3')
+
+    def test_users_stay_on_primary(self):
+        user = User(pk=1, username='sharded')
+        self.assertEqual(router.db_for_write(User, instance=user), 'default')
+        self.assertEqual(router.db_for_read(User), 'default')
+
+    def test_split_by_shard(self):
+        tasks = [Task(user_id=user_id, title=str(user_id)) for user_id in (1, 7, 2)]
+        groups = Task.objects.split_by_shard(tasks)
+        self.assertEqual({shard: [task.user_id for task in group] for shard, group in groups.items()}, {
+            'shard3': [1],
+            'shard1': [7],
+            'shard2': [2],
+        })
+        self.assertIsNone(Task.objects.using('shard1').split_by_shard(tasks))
+
+    @override_settings(TASK_SHARDS=['default', 'shard2'])
+    def test_primary_shard_is_left_to_other_routers(self):
+        self.assertEqual(sharding.shard_for_user(4), 'default')
+        self.assertIsNone(sharding.ShardRouter().db_for_read(Task, user_id=4))
+        self.assertEqual(Task.objects.on_shard_of(4).db, 'default')
+        self.assertEqual(Task.objects.on_shard_of(1).db, 'shard2')
+
+    @override_settings(TASK_SHARDS=[])
+    def test_unsharded(self):
+        self.assertFalse(sharding.is_sharded())
+        self.assertEqual(Task.objects.on_shard_of(1).db, 'default')
+        queryset = Task.objects.all()
+        self.assertIs(sharding.fan_out(queryset), queryset)
+
+
+class FanOutQuerySetTestCase(TestCase):
+    """
+    Test merging querysets across shards, with one queryset per user on
+    the test database standing in for the shards
+    """
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f'shard{i}', password='testpass123', first_name='Shard')
+            for i in range(3)
+        ]
+        now = timezone.now()
+        for i in range(12):
+            task = Task.objects.create(title=f'Task {i:02}', user=self.users[i % 3])
+            Task.objects.filter(pk=task.pk).update(created_at=now - timedelta(minutes=i))
+
+    def fan_out(self, queryset):
+        return sharding.FanOutQuerySet([queryset.filter(user=user) for user in self.users])
+
+    def test_rows_are_merge_sorted(self):
+        merged = self.fan_out(Task.objects.order_by('-created_at'))
+        self.assertEqual([task.title for task in merged], [f'Task {i:02}' for i in range(12)])
+        self.assertEqual([task.title for task in merged.order_by('title')[3:6]], ['Task 03', 'Task 04', 'Task 05'])
+        self.assertEqual(merged[4].title, 'Task 04')
+
+    def test_default_ordering(self):
+        titles = [task.title for task in self.fan_out(Task.objects.all())[:3]]
+        self.assertEqual(titles, ['Task 00', 'Task 01', 'Task 02'])
+
+    def test_chained_methods_apply_to_every_shard(self):
+        merged = self.fan_out(Task.objects.all()).filter(title__lt='Task 06').order_by('title')
+        self.assertIsInstance(merged, sharding.FanOutQuerySet)
+        self.assertEqual(merged.count(), 6)
+        self.assertEqual(len(merged[:10]), 6)
+        self.assertTrue(merged.exists())
+
+    def test_values_rows_gain_ordering_columns(self):
+        serializer = TaskValuesSerializer(fields={'id', 'status'})
+        merged = serializer.values(self.fan_out(Task.objects.order_by('-created_at')))
+        data = serializer.to_representation(merged[:2])
+        self.assertEqual(set(data[0]), {'id', 'status'})
+
+        rows = self.fan_out(Task.objects.order_by('title')).values_list('id')[:2]
+        self.assertEqual([row.title for row in rows], ['Task 00', 'Task 01'])
+
+    def test_get(self):
+        task = Task.objects.get(title='Task 05')
+        self.assertEqual(self.fan_out(Task.objects.all()).get(pk=task.pk), task)
+        with self.assertRaises(Task.DoesNotExist):
+            self.fan_out(Task.objects.all()).get(pk=0)
+
+    def test_aggregates_and_dates(self):
+        merged = self.fan_out(Task.objects.all())
+        result = merged.aggregate(tasks=Count('id'), latest=Max('created_at'))
+        self.assertEqual(result['tasks'], 12)
+        self.assertEqual(result['latest'], Task.objects.aggregate(latest=Max('created_at'))['latest'])
+        self.assertEqual(merged.dates('created_at', 'year'), list(Task.objects.dates('created_at', 'year')))
+
+    def test_writes(self):
+        merged = self.fan_out(Task.objects.filter(title__lt='Task 03'))
+        self.assertEqual(merged.update(status='Completed'), 3)
+        deleted, _ = merged.delete()
+        self.assertEqual(deleted, 3)
+        self.assertEqual(Task.objects.count(), 9)
@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Task
+
+User = get_user_model()
+
+
+@override_settings(TASK_LIST_CACHE_ALIAS='uncached', CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'uncached': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+})
+class TaskSummaryTestCase(APITestCase):
+    """Test the maintained task counters and the summary endpoint"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='summaryuser',
+            password='testpass123',
+            first_name='Summary'
+        )
+        self.other = User.objects.create_user(
+            username='summaryother',
+            password='testpass123',
+            first_name='Other'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('task-summary')
+
+    def summary(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_counts_follow_every_write_path(self):
+        task = Task.objects.create(title='One', user=self.user)
+        Task.objects.bulk_create([
+            Task(title='Two', status='In Progress', user=self.user),
+            Task(title='Three', user=self.user),
+            Task(title='Foreign', user=self.other),
+        ])
+        self.assertEqual(self.summary(), {'new': 2, 'in_progress': 1, 'completed': 0, 'total': 3})
+
+        self.client.post(reverse('task-complete', args=[task.id]))
+        self.client.patch(reverse('task-detail', args=[task.id]), {'title': 'Renamed'})
+        self.assertEqual(self.summary(), {'new': 1, 'in_progress': 1, 'completed': 1, 'total': 3})
+
+        self.client.post(reverse('task-bulk'), {'delete': [task.id]}, format='json')
+        Task.objects.filter(user=self.user, status='New').complete()
+        self.assertEqual(self.summary(), {'new': 0, 'in_progress': 1, 'completed': 1, 'total': 2})
+
+    def test_summary_without_tasks(self):
+        self.assertEqual(self.summary(), {'new': 0, 'in_progress': 0, 'completed': 0, 'total': 0})
+
+    def test_list_total_comes_from_counters(self):
+        Task.objects.bulk_create(
+            Task(title=f'Task {i}', status='Completed' if i % 3 else 'New', user=self.user)
+            for i in range(15)
+        )
+        for query, expected in (('', 15), ('?status=New', 5), ('?status=Completed&ordering=title', 10)):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse('task-list-create') + query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['count'], expected)
+            sql = ' '.join(q['sql'] for q in ctx.captured_queries).upper()
+            self.assertNotIn('COUNT(', sql)
@@ -0,0 +1,55 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Task, TaskCounter, TaskTombstone
+
+User = get_user_model()
+
+
+class UserDeleteTestCase(TestCase):
+    """Test deleting users with their tasks in batches"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='deleteuser', password='testpass123', first_name='Delete')
+        self.other = User.objects.create_user(username='keepuser', password='testpass123', first_name='Keep')
+        Task.objects.bulk_create(Task(title=f'Task {i}', user=self.user) for i in range(5))
+        Task.objects.create(title='Kept', user=self.other)
+        Task.objects.filter(user=self.user, title='Task 0').delete()
+
+    def test_delete_tasks_reports_progress(self):
+        progress = list(self.user.delete_tasks(batch_size=2))
+        self.assertEqual(progress, [(Task, 2), (Task, 4), (TaskTombstone, 1)])
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+        self.assertEqual(Task.objects.get().title, 'Kept')
+
+    def test_delete_user(self):
+        total, per_model = self.user.delete()
+        self.assertEqual(per_model['core.Task'], 4)
+        self.assertEqual(per_model['core.TaskTombstone'], 1)
+        self.assertEqual(total, sum(per_model.values()))
+        self.assertFalse(User.objects.filter(username='deleteuser').exists())
+        self.assertFalse(TaskCounter.objects.filter(user_id=self.user.pk).exists())
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_delete_users_command(self):
+        out = StringIO()
+        call_command('delete_users', 'deleteuser', batch_size=3, stdout=out)
+        self.assertIn('deleteuser: deleted 3 tasks', out.getvalue())
+        self.assertIn('deleteuser: deleted 4 tasks', out.getvalue())
+        self.assertFalse(User.objects.filter(username='deleteuser').exists())
+
+    def test_admin_confirmation_counts_tasks(self):
+        admin = User.objects.create_superuser(username='admin', password='testpass123', first_name='Admin')
+        self.client.force_login(admin)
+        url = reverse('admin:core_customuser_delete', args=[self.user.pk])
+        response = self.client.get(url)
+        self.assertContains(response, 'Tasks: 4')
+        self.assertNotContains(response, 'Task 1')
+
+        response = self.client.post(url, {'post': 'yes'})
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(User.objects.filter(username='deleteuser').exists())
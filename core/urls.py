@@ -3,10 +3,17 @@ from django.urls import path
 from .views import (
     TaskListAllView, 
     TaskListCreateView, 
+    BulkTaskView,
     TaskDetailView, 
     MarkTaskCompletedView, 
+    CompleteMatchingTasksView,
     RegisterView,
-    UserTasksView
+    UserTasksView,
+    TaskChangesView,
+    TaskExportView,
+    TaskImportView,
+    TaskCacheStatsView,
+    TaskSummaryView
 )
 
 
@@ -17,6 +24,13 @@ urlpatterns = [
     # Task endpoints
     path('tasks/all/', TaskListAllView.as_view(), name='task-list-all'),
     path('tasks/', TaskListCreateView.as_view(), name='task-list-create'),
+    path('tasks/bulk/', BulkTaskView.as_view(), name='task-bulk'),
+    path('tasks/complete/', CompleteMatchingTasksView.as_view(), name='task-complete-matching'),
+    path('tasks/changes/', TaskChangesView.as_view(), name='task-changes'),
+    path('tasks/export/', TaskExportView.as_view(), name='task-export'),
+    path('tasks/import/', TaskImportView.as_view(), name='task-import'),
+    path('tasks/summary/', TaskSummaryView.as_view(), name='task-summary'),
+    path('tasks/cache-stats/', TaskCacheStatsView.as_view(), name='task-cache-stats'),
     path('tasks/user/', UserTasksView.as_view(), name='user-tasks'),
     path('tasks/<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
     path('tasks/<int:pk>/complete/', MarkTaskCompletedView.as_view(), name='task-complete'),
@@ -3,18 +3,32 @@ from django.shortcuts import render
 from rest_framework.generics import CreateAPIView
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
+from django.http import Http404, StreamingHttpResponse
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+import hashlib
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import OrderingFilter
+from rest_framework.parsers import MultiPartParser
+import io
 
-from .models import Task, CustomUser
+from .filters import TaskFilterSet, TaskOrderingFilter, TaskSearchFilter
+from .models import Task, CustomUser, TaskCounter, TaskVersion
+from .pagination import TaskPagination
+from . import export, response_cache, sharding, sync
+from .importer import FORMATS as IMPORT_FORMATS, ImportFileError, TaskImporter, guess_format
+from .renderers import CSVRenderer, NDJSONRenderer
 from .serializers import (
     TaskSerializer, 
     TaskCreateSerializer, 
     TaskUpdateSerializer, 
     UserRegisterSerializer, 
-    UserSerializer
+    UserSerializer,
+    BulkTaskSerializer,
+    TaskValuesSerializer
 )
 
 
@@ -24,7 +38,7 @@ class IsOwner(permissions.BasePermission):
     Custom permission to only allow owners of an object to edit it.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.user == request.user
+        return obj.user_id == request.user.pk
     
 
 class RegisterView(generics.CreateAPIView):
@@ -47,24 +61,269 @@ class RegisterView(generics.CreateAPIView):
 
 class TaskFilterMixin:
     """
-    Mixin for adding filtering and ordering to task views
+    Mixin for adding filtering, ordering and pagination to task views
     """
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ['status']
-    ordering_fields = ['created_at', 'title']
+    filter_backends = [DjangoFilterBackend, TaskSearchFilter, TaskOrderingFilter]
+    filterset_class = TaskFilterSet
+    ordering_fields = ['created_at', 'updated_at', 'title']
     ordering = ['-created_at']
+    pagination_class = TaskPagination
 
 
-class TaskListAllView(TaskFilterMixin, generics.ListAPIView):
+class TaskFieldsMixin:
+    """
+    Mixin for sparse fieldsets on GET: ``?fields=id,title,status`` trims
+    the serialized tasks and loads only the matching columns
+    """
+    fields_param = 'fields'
+    # Serializer field -> columns it reads
+    FIELD_COLUMNS = {
+        'id': ['id'],
+        'title': ['title'],
+        'description': ['description'],
+        'status': ['status'],
+        'user': ['user__username'],
+        'created_at': ['created_at'],
+        'updated_at': ['updated_at'],
+    }
+    # Columns read outside the serializer: cursors, ordering and validators
+    ALWAYS_LOADED = ['id', 'user', 'title', 'created_at', 'updated_at']
+
+    def get_requested_fields(self):
+        if self.request.method not in permissions.SAFE_METHODS:
+            return None
+        value = self.request.query_params.get(self.fields_param)
+        if not value:
+            return None
+        requested = {name.strip() for name in value.split(',') if name.strip()}
+        unknown = requested - set(self.FIELD_COLUMNS)
+        if unknown:
+            raise ValidationError({
+                self.fields_param: [f"Unknown fields: {', '.join(sorted(unknown))}"]
+            })
+        return requested
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        requested = self.get_requested_fields()
+        if not requested:
+            return queryset
+        columns = list(self.ALWAYS_LOADED)
+        for name in requested:
+            columns.extend(self.FIELD_COLUMNS[name])
+        if 'user' not in requested:
+            queryset = queryset.select_related(None)
+        return queryset.only(*columns)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
+
+
+class TaskValuesListMixin:
+    """
+    Mixin rendering task lists through TaskValuesSerializer, the read-only
+    fast path of TaskSerializer
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer = TaskValuesSerializer(fields=self.get_requested_fields())
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(queryset))
+
+
+def make_etag(*parts):
+    """Build a strong ETag from the parts that determine a representation"""
+    return quote_etag(hashlib.sha1(':'.join(map(str, parts)).encode()).hexdigest())
+
+
+def set_validators(response, etag, last_modified):
+    if etag and not response.has_header('ETag'):
+        response['ETag'] = etag
+    if last_modified and not response.has_header('Last-Modified'):
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+class TaskCollectionMixin:
+    """
+    Mixin for list views over a versioned task collection: the requesting
+    user's tasks, or every task when ``collection_scope = 'all'``
+    """
+    collection_scope = 'user'
+
+    def get_collection_version(self):
+        """
+        Return ``(token, changed_at)`` for the collection, read once per
+        request and before any task data. The token is None where the
+        collection has no version.
+        """
+        if not hasattr(self, '_collection_version'):
+            if self.collection_scope == 'all':
+                self._collection_version = (TaskVersion.objects.global_version(), None)
+            else:
+                self._collection_version = TaskVersion.objects.for_user(self.request.user)
+        return self._collection_version
+
+    def get_collection_scope(self):
+        if self.collection_scope == 'all':
+            return 'all'
+        return f'user:{self.request.user.pk}:{self.request.user.username}'
+
+    # Query parameters that do not narrow down the list
+    UNFILTERED_PARAMS = {'page', 'ordering', 'format', 'fields'}
+
+    def get_list_count(self):
+        """
+        Total for the paginator from the user's task counters, or None to
+        count the filtered queryset
+        """
+        params = self.request.query_params
+        if self.collection_scope == 'all' or set(params) - self.UNFILTERED_PARAMS - {'status'}:
+            return None
+        counts = TaskCounter.objects.for_user(self.request.user)
+        statuses = params.getlist('status')
+        if not statuses:
+            return sum(counts.values())
+        if len(statuses) == 1:
+            return counts.get(statuses[0])
+        return None
+
+
+class ConditionalListMixin(TaskCollectionMixin):
+    """
+    Mixin for answering conditional GETs on task lists. Validators come
+    from the task collection version, so a 304 is returned without running
+    the list query or serializing anything.
+    """
+
+    def list(self, request, *args, **kwargs):
+        token, last_modified = self.get_collection_version()
+        if token is None:
+            return super().list(request, *args, **kwargs)
+
+        etag = make_etag(
+            'list', self.get_collection_scope(), token,
+            request.get_full_path(), request.accepted_media_type
+        )
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp())
+        )
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
+
+
+class CachedListMixin(TaskCollectionMixin):
+    """
+    Mixin for caching list responses under the task collection version.
+    Any task write advances the version, which invalidates every cached
+    page of the collection at once.
+    """
+
+    def list(self, request, *args, **kwargs):
+        token, _ = self.get_collection_version()
+        if token is None:
+            return super().list(request, *args, **kwargs)
+
+        key = response_cache.make_key(self.get_collection_scope(), token, request)
+        data = response_cache.lookup(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.store(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+
+class ConditionalDetailMixin:
+    """
+    Mixin for conditional requests on a single task, validated by its
+    ``updated_at``. GET/HEAD honour If-None-Match/If-Modified-Since;
+    PUT/PATCH/DELETE honour If-Match/If-Unmodified-Since and lock the row
+    while the precondition is checked.
+    """
+    PRECONDITION_HEADERS = ('HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE')
+
+    def get_task_validators(self, request, updated_at):
+        etag = make_etag(
+            'task', self.kwargs['pk'], request.user.username,
+            f'{updated_at.timestamp():.6f}', request.accepted_media_type
+        )
+        return etag, updated_at
+
+    def evaluate_preconditions(self, request, updated_at):
+        etag, last_modified = self.get_task_validators(request, updated_at)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp())
+        )
+        return response, etag, last_modified
+
+    def retrieve(self, request, *args, **kwargs):
+        task = self.get_object()
+        response, etag, last_modified = self.evaluate_preconditions(request, task.updated_at)
+        if response is None:
+            response = Response(self.get_serializer(task).data)
+        return set_validators(response, etag, last_modified)
+
+    def conditional_write(self, write, request, *args, **kwargs):
+        if not any(header in request.META for header in self.PRECONDITION_HEADERS):
+            return write(request, *args, **kwargs)
+        queryset = self.get_queryset()
+        db = queryset.write_db()
+        with transaction.atomic(using=db):
+            # The write locks the owner's version before the task, as every
+            # task write does; so does the precondition check
+            TaskVersion.objects.using(db).lock([request.user.pk])
+            updated_at = (
+                queryset
+                .select_for_update(of=('self',))
+                .filter(pk=self.kwargs['pk'])
+                .values_list('updated_at', flat=True)
+                .first()
+            )
+            # Missing tasks fall through to the view's 404
+            if updated_at is not None:
+                response, _, _ = self.evaluate_preconditions(request, updated_at)
+                if response is not None:
+                    return response
+            return write(request, *args, **kwargs)
+
+    def update(self, request, *args, **kwargs):
+        return self.conditional_write(super().update, request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        return self.conditional_write(super().destroy, request, *args, **kwargs)
+
+
+class TaskListAllView(ConditionalListMixin, CachedListMixin, TaskValuesListMixin, TaskFieldsMixin, TaskFilterMixin, generics.ListAPIView):
     """
     Get a list of all tasks (for admin purposes)
     """
-    queryset = Task.objects.all()
+    collection_scope = 'all'
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        """
+        Every shard's tasks, merged in order. They are read on the primary,
+        where the global version is: rows from a lagging replica would be
+        cached and ETagged under a newer version.
+        """
+        return sharding.fan_out(Task.objects.using(DEFAULT_DB_ALIAS).select_related('user'))
 
-class TaskListCreateView(TaskFilterMixin, generics.ListCreateAPIView):
+
+class TaskListCreateView(ConditionalListMixin, CachedListMixin, TaskValuesListMixin, TaskFieldsMixin, TaskFilterMixin, generics.ListCreateAPIView):
     """
     Get a list of all user's tasks and create new tasks
     """
@@ -72,7 +331,7 @@ class TaskListCreateView(TaskFilterMixin, generics.ListCreateAPIView):
 
     def get_queryset(self):
         """Return tasks for the current user only"""
-        return Task.objects.filter(user=self.request.user)
+        return Task.objects.owned_by(self.request.user).select_related('user')
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -84,7 +343,100 @@ class TaskListCreateView(TaskFilterMixin, generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BulkTaskView(APIView):
+    """
+    Create, update, complete and delete many of the user's tasks at once.
+    Each operation runs as a single set-based query and every item gets
+    its own result entry.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkTaskSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        with transaction.atomic(using=self.get_queryset().write_db()):
+            results = {
+                'create': self.bulk_create(data.get('create', [])),
+                'update': self.bulk_update(data.get('update', [])),
+                'complete': self.bulk_complete(data.get('complete', [])),
+                'delete': self.bulk_delete(data.get('delete', [])),
+            }
+        return Response(results, status=status.HTTP_200_OK)
+
+    def get_queryset(self):
+        return Task.objects.owned_by(self.request.user)
+
+    def bulk_create(self, items):
+        results = []
+        tasks = []
+        for index, item in enumerate(items):
+            serializer = TaskCreateSerializer(data=item)
+            if serializer.is_valid():
+                task = Task(user=self.request.user, **serializer.validated_data)
+                tasks.append(task)
+                results.append({'index': index, 'status': status.HTTP_201_CREATED, 'task': task})
+            else:
+                results.append({'index': index, 'status': status.HTTP_400_BAD_REQUEST, 'errors': serializer.errors})
+
+        Task.objects.bulk_create(tasks)
+        for result in results:
+            if 'task' in result:
+                result['task'] = TaskSerializer(result['task']).data
+        return results
+
+    def bulk_update(self, items):
+        tasks = self.get_queryset().select_related('user').in_bulk([item['id'] for item in items])
+        results = []
+        changed = {}
+        fields = {'updated_at'}
+        now = timezone.now()
+        for item in items:
+            pk = item['id']
+            task = tasks.get(pk)
+            if task is None:
+                results.append({'id': pk, 'status': status.HTTP_404_NOT_FOUND})
+                continue
+            values = {key: value for key, value in item.items() if key != 'id'}
+            serializer = TaskUpdateSerializer(task, data=values, partial=True)
+            if not serializer.is_valid():
+                results.append({'id': pk, 'status': status.HTTP_400_BAD_REQUEST, 'errors': serializer.errors})
+                continue
+            for attr, value in serializer.validated_data.items():
+                setattr(task, attr, value)
+                fields.add(attr)
+            task.updated_at = now
+            changed[pk] = task
+            results.append({'id': pk, 'status': status.HTTP_200_OK})
+
+        if changed:
+            Task.objects.bulk_update(changed.values(), sorted(fields))
+        for result in results:
+            if result['status'] == status.HTTP_200_OK:
+                result['task'] = TaskSerializer(changed[result['id']]).data
+        return results
+
+    def bulk_complete(self, ids):
+        found = set(self.get_queryset().filter(id__in=ids).values_list('id', flat=True))
+        if found:
+            self.get_queryset().filter(id__in=found).complete()
+        return [
+            {'id': pk, 'status': status.HTTP_200_OK if pk in found else status.HTTP_404_NOT_FOUND}
+            for pk in ids
+        ]
+
+    def bulk_delete(self, ids):
+        found = set(self.get_queryset().filter(id__in=ids).values_list('id', flat=True))
+        if found:
+            self.get_queryset().filter(id__in=found).delete()
+        return [
+            {'id': pk, 'status': status.HTTP_204_NO_CONTENT if pk in found else status.HTTP_404_NOT_FOUND}
+            for pk in ids
+        ]
+
+
+class TaskDetailView(ConditionalDetailMixin, TaskFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Get information about a specific task, update and delete tasks
     Only the owner can update/delete their tasks
@@ -93,7 +445,7 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """Return tasks for the current user only"""
-        return Task.objects.filter(user=self.request.user)
+        return Task.objects.owned_by(self.request.user).select_related('user')
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -108,10 +460,10 @@ class MarkTaskCompletedView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        task = get_object_or_404(Task, pk=pk, user=request.user)
-        task.status = 'Completed'
-        task.save()
-        
+        task = Task.objects.complete_one(pk, request.user)
+        if task is None:
+            raise Http404
+
         serializer = TaskSerializer(task)
         return Response({
             'message': 'Task marked as completed.',
@@ -119,17 +471,142 @@ class MarkTaskCompletedView(APIView):
         }, status=status.HTTP_200_OK)
     
 
-class UserTasksView(generics.ListAPIView):
+class CompleteMatchingTasksView(TaskFilterMixin, generics.GenericAPIView):
+    """
+    Mark every task of the user that matches the filters as completed
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Return tasks for the current user only"""
+        return Task.objects.owned_by(self.request.user)
+
+    def post(self, request):
+        completed = self.filter_queryset(self.get_queryset()).complete()
+        return Response({
+            'message': 'Tasks marked as completed.',
+            'completed': completed
+        }, status=status.HTTP_200_OK)
+
+
+class TaskChangesView(APIView):
+    """
+    Delta sync: tasks created or updated and ids of tasks deleted since
+    the cursor returned by the previous call
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 100
+    max_limit = 1000
+
+    def get(self, request):
+        since = request.query_params.get('since')
+        cursor = sync.decode_cursor(since) if since else sync.initial_cursor(request.user)
+        try:
+            limit = min(int(request.query_params.get('limit', self.default_limit)), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+        limit = max(limit, 1)
+
+        changes = sync.get_changes(request.user, cursor, limit)
+        return Response({
+            'changed': TaskSerializer(changes.tasks, many=True).data,
+            'deleted': changes.deleted,
+            'cursor': changes.cursor,
+            'has_more': changes.has_more,
+        }, status=status.HTTP_200_OK)
+
+
+class TaskExportView(TaskFilterMixin, generics.GenericAPIView):
+    """
+    Stream the user's tasks (every task for staff) as NDJSON or CSV.
+    Honours the list filters and ordering; pick the format with the
+    Accept header or ``?format=ndjson|csv``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    pagination_class = None
+
+    def get_queryset(self):
+        if self.request.user.is_staff:
+            return sharding.fan_out(Task.objects.all())
+        return Task.objects.owned_by(self.request.user)
+
+    def get(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        if request.accepted_renderer.format == 'csv':
+            rows, extension = export.iter_csv(queryset), 'csv'
+        else:
+            rows, extension = export.iter_ndjson(queryset), 'ndjson'
+
+        response = StreamingHttpResponse(rows, content_type=request.accepted_renderer.media_type)
+        response['Content-Disposition'] = f'attachment; filename="tasks.{extension}"'
+        return response
+
+
+class TaskImportView(APIView):
+    """
+    Import tasks from an uploaded CSV or NDJSON file (``file`` field).
+    Valid rows are loaded in one transaction; invalid rows are reported
+    with their line numbers.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'file': ['No file was submitted.']}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.data.get('format') or guess_format(upload.name)
+        if fmt not in IMPORT_FORMATS:
+            return Response(
+                {'format': [f"Format must be one of: {', '.join(IMPORT_FORMATS)}"]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+        try:
+            result = TaskImporter(request.user).run(stream, fmt)
+        except UnicodeDecodeError:
+            return Response({'file': ['File must be UTF-8 encoded.']}, status=status.HTTP_400_BAD_REQUEST)
+        except ImportFileError as exc:
+            return Response({'file': [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'imported': result.imported,
+            'failed': result.failed,
+            'errors': result.errors,
+        }, status=status.HTTP_201_CREATED if result.imported else status.HTTP_400_BAD_REQUEST)
+
+
+class TaskSummaryView(APIView):
+    """
+    Counts of the user's tasks by status, read from the task counters
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        counts = TaskCounter.objects.for_user(request.user)
+        summary = {TaskCounter.FIELDS[key]: value for key, value in counts.items()}
+        summary['total'] = sum(counts.values())
+        return Response(summary, status=status.HTTP_200_OK)
+
+
+class TaskCacheStatsView(APIView):
+    """
+    Hit/miss counters of the task list response cache in this process
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(response_cache.stats.snapshot())
+
+
+class UserTasksView(ConditionalListMixin, CachedListMixin, TaskValuesListMixin, TaskFieldsMixin, TaskFilterMixin, generics.ListAPIView):
     """
     Get a list of all user's tasks (alternative endpoint)
     """
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ['status']
-    ordering_fields = ['created_at', 'title']
-    ordering = ['-created_at']
 
     def get_queryset(self):
         """Return tasks for the current user only"""
-        return Task.objects.filter(user=self.request.user)
\ No newline at end of file
+        return Task.objects.owned_by(self.request.user).select_related('user')
\ No newline at end of file